@@ -0,0 +1,246 @@
+#Alpha-beta search computer player for the headless Dastan engine (Engine.py)
+#run this file to play against the computer as Player One
+#python AlphaBetaPlayer.py --check 4 checks that the transposition table does not change search results
+
+import argparse
+import random
+import sys
+import time
+from Engine import Dastan
+from TranspositionTable import TranspositionTable, EXACT, LOWERBOUND, UPPERBOUND, EncodeMove, DecodeMove
+
+WINSCORE = 10000
+INFINITY = 1000000
+
+class SearchTimeout(Exception):
+    pass
+
+class AlphaBetaPlayer:
+    # Negamax alpha-beta with iterative deepening. The game's own rules do the
+    # scoring: make_move charges the choice cost -(Choice + 2 * (Choice - 1)) and
+    # the offer cost, and adds the capture and kotla occupancy points, so a leaf
+    # is worth the difference between the two players' scores. A finished game
+    # is worth an extra WINSCORE to the player ahead.
+    # Taking the offer is searched as if the same option stays on offer, since
+    # the real next offer is random.
+    # Values depend on the scores, which the game's hash leaves out, so the
+    # transposition table is keyed on the hash and both scores together.
+    def __init__(self, TimeLimitMs=1000, MaxDepth=32, TTSizeInMB=16, UseOffers=True, UseTranspositionTable=True):
+        self.__TimeLimitMs = TimeLimitMs
+        self.__MaxDepth = MaxDepth
+        self.__UseOffers = UseOffers
+        self.__TT = None
+        if UseTranspositionTable:
+            self.__TT = TranspositionTable(TTSizeInMB)
+        self.__Deadline = 0
+        self.__Nodes = 0
+        self.__LastSearchInfo = {}
+
+    def GetLastSearchInfo(self):
+        return self.__LastSearchInfo
+
+    def ChooseMove(self, Game):
+        # Returns (Move, OfferSlot): take the offer into OfferSlot first if it is
+        # not 0, then play Move, which is None if there is nothing legal to play.
+        StartTime = time.perf_counter()
+        self.__Deadline = StartTime + self.__TimeLimitMs / 1000
+        self.__Nodes = 0
+        if self.__TT is not None:
+            self.__TT.NewSearch()
+        Actions = self.__GetActions(Game, 0)
+        if not Actions:
+            return (None, 0)
+        BestAction = Actions[0]
+        BestValue = 0
+        CompletedDepth = 0
+        for Depth in range(1, self.__MaxDepth + 1):
+            try:
+                BestValue, BestAction = self.__SearchRoot(Game, Depth, Actions)
+            except SearchTimeout:
+                break
+            CompletedDepth = Depth
+            Actions.remove(BestAction)
+            Actions.insert(0, BestAction)
+            if abs(BestValue) >= WINSCORE:
+                break
+        self.__LastSearchInfo = {"Depth": CompletedDepth, "Value": BestValue, "Nodes": self.__Nodes, "TimeMs": (time.perf_counter() - StartTime) * 1000}
+        return BestAction
+
+    def SearchToDepth(self, Game, Depth):
+        # Returns (Value, (Move, OfferSlot)) from one search of exactly Depth
+        # plies with no time limit, or (None, (None, 0)) if there is no move.
+        self.__Deadline = float("inf")
+        self.__Nodes = 0
+        if self.__TT is not None:
+            self.__TT.NewSearch()
+        Actions = self.__GetActions(Game, 0)
+        if not Actions:
+            return (None, (None, 0))
+        return self.__SearchRoot(Game, Depth, Actions)
+
+    def PlayTurn(self, Game):
+        Move, OfferSlot = self.ChooseMove(Game)
+        if OfferSlot:
+            Game.take_offer(OfferSlot)
+        Game.apply(Move)
+
+    def __SearchRoot(self, Game, Depth, Actions):
+        Alpha = -INFINITY
+        BestAction = Actions[0]
+        OfferPosition = Game.GetMoveOptionOfferPosition()
+        for Move, OfferSlot in Actions:
+            Undo = Game.make_move(Move, OfferSlot, OfferPosition)
+            try:
+                Value = -self.__Search(Game, Depth - 1, -INFINITY, -Alpha)
+            finally:
+                Game.unmake_move(Undo)
+            if Value > Alpha:
+                Alpha = Value
+                BestAction = (Move, OfferSlot)
+        if self.__TT is not None:
+            self.__TT.Store(Game.GetSearchKey(), Depth, Alpha, EXACT, EncodeMove(BestAction[0], BestAction[1]))
+        return Alpha, BestAction
+
+    def __Search(self, Game, Depth, Alpha, Beta):
+        self.__Nodes += 1
+        if self.__Nodes & 255 == 0 and time.perf_counter() > self.__Deadline:
+            raise SearchTimeout()
+        if Game.is_terminal():
+            return self.__Evaluate(Game, True)
+        if Depth == 0:
+            return self.__Evaluate(Game, False)
+        Key = 0
+        TTMove = 0
+        Entry = None
+        if self.__TT is not None:
+            Key = Game.GetSearchKey()
+            Entry = self.__TT.Probe(Key)
+        if Entry is not None:
+            EntryDepth, EntryValue, EntryBound, TTMove = Entry
+            if EntryDepth >= Depth:
+                if EntryBound == EXACT:
+                    return EntryValue
+                elif EntryBound == LOWERBOUND and EntryValue >= Beta:
+                    return EntryValue
+                elif EntryBound == UPPERBOUND and EntryValue <= Alpha:
+                    return EntryValue
+        AlphaOriginal = Alpha
+        Actions = self.__GetActions(Game, TTMove)
+        if not Actions:
+            Actions = [(None, 0)]
+        BestValue = -INFINITY
+        BestAction = Actions[0]
+        OfferPosition = Game.GetMoveOptionOfferPosition()
+        for Move, OfferSlot in Actions:
+            Undo = Game.make_move(Move, OfferSlot, OfferPosition)
+            try:
+                Value = -self.__Search(Game, Depth - 1, -Beta, -Alpha)
+            finally:
+                Game.unmake_move(Undo)
+            if Value > BestValue:
+                BestValue = Value
+                BestAction = (Move, OfferSlot)
+                if Value > Alpha:
+                    Alpha = Value
+                    if Alpha >= Beta:
+                        break
+        if BestValue <= AlphaOriginal:
+            Bound = UPPERBOUND
+        elif BestValue >= Beta:
+            Bound = LOWERBOUND
+        else:
+            Bound = EXACT
+        if self.__TT is not None:
+            self.__TT.Store(Key, Depth, BestValue, Bound, EncodeMove(BestAction[0], BestAction[1]))
+        return BestValue
+
+
+    def __Evaluate(self, Game, GameOver):
+        Player1Score, Player2Score = Game.scores()
+        if Game.GetCurrentPlayer().GetId() == 1:
+            Value = Player1Score - Player2Score
+        else:
+            Value = Player2Score - Player1Score
+        if GameOver:
+            if Value > 0:
+                Value += WINSCORE
+            elif Value < 0:
+                Value -= WINSCORE
+        return Value
+
+    def __GetActions(self, Game, TTMove):
+        # Hash move first, then captures of the most valuable piece, then the
+        # cheapest moves to make.
+        CurrentPlayer = Game.GetCurrentPlayer()
+        Ordered = []
+        for Move in Game.GenerateLegalMoves(CurrentPlayer):
+            Ordered.append((self.__GetOrderKey(Game, Move, 0), Move, 0))
+        if self.__UseOffers:
+            for Move in Game.GenerateOfferMoves(CurrentPlayer):
+                Ordered.append((self.__GetOrderKey(Game, Move, Move[0]), Move, Move[0]))
+        Ordered.sort(key=lambda Item: Item[0])
+        Actions = [(Move, OfferSlot) for Key, Move, OfferSlot in Ordered]
+        if TTMove:
+            HashAction = DecodeMove(TTMove)
+            if HashAction in Actions:
+                Actions.remove(HashAction)
+                Actions.insert(0, HashAction)
+        return Actions
+
+    def __GetOrderKey(self, Game, Move, OfferSlot):
+        Choice = Move[0]
+        Cost = Choice + (2 * (Choice - 1))
+        if OfferSlot:
+            Cost += 10 - (OfferSlot * 2)
+        return (-Game.GetCapturePoints(Move[2]), Cost)
+
+def CheckTranspositionTable(Depth, NoOfPositions=30, Seed=1, UseOffers=False):
+    # Searches positions some random moves into seeded games to each depth up to
+    # Depth in turn, as iterative deepening does, with one table kept across the
+    # depths and with no table at all. Returns the searches whose root values
+    # differ, which would mean a table entry was used where it did not belong.
+    # Offers are left out by default as they make each search much slower.
+    # With the default seed, game 19 at depth 4 gives a wrong value if the table
+    # is keyed on the hash alone, without the scores.
+    Rng = random.Random(Seed)
+    Mismatches = []
+    for PositionNo in range(NoOfPositions):
+        Game = Dastan(6, 6, 4, Seed + PositionNo)
+        for Count in range(Rng.randint(6, 40)):
+            Moves = Game.GenerateLegalMoves(Game.GetCurrentPlayer())
+            if Game.is_terminal() or not Moves:
+                break
+            Game.make_move(Rng.choice(Moves))
+        if Game.is_terminal():
+            continue
+        WithTable = AlphaBetaPlayer(TTSizeInMB=8, UseOffers=UseOffers)
+        WithoutTable = AlphaBetaPlayer(UseOffers=UseOffers, UseTranspositionTable=False)
+        for SearchDepth in range(1, Depth + 1):
+            Value = WithTable.SearchToDepth(Game, SearchDepth)[0]
+            ExpectedValue = WithoutTable.SearchToDepth(Game, SearchDepth)[0]
+            if Value != ExpectedValue:
+                Mismatches.append((Seed + PositionNo, SearchDepth, Value, ExpectedValue))
+    return Mismatches
+
+def Main():
+    Parser = argparse.ArgumentParser(description="Play Dastan against the alpha-beta computer player.")
+    Parser.add_argument("--check", type=int, metavar="DEPTH", help="check the transposition table at this search depth instead of playing")
+    Parser.add_argument("--positions", type=int, default=30, help="positions searched by --check")
+    Parser.add_argument("--seed", type=int, default=1, help="seed of the games searched by --check")
+    Parser.add_argument("--offers", action="store_true", help="include taking the offer in the searches made by --check")
+    Args = Parser.parse_args()
+    if Args.check:
+        Mismatches = CheckTranspositionTable(Args.check, Args.positions, Args.seed, Args.offers)
+        for GameSeed, SearchDepth, WithTable, WithoutTable in Mismatches:
+            print("Game " + str(GameSeed) + " at depth " + str(SearchDepth) + ": " + str(WithTable) + " with the table, " + str(WithoutTable) + " without")
+        print(str(len(Mismatches)) + " searches differ with the table up to depth " + str(Args.check))
+        if Mismatches:
+            sys.exit(1)
+        return
+    ThisGame = Dastan(6, 6, 4)
+    ThisGame.PlayGame({1: AlphaBetaPlayer(1000)})
+    print("Goodbye!")
+    input()
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,200 @@
+#Benchmarks of the hot paths of each Dastan variant, for pytest-benchmark
+#python Benchmarks.py --save measures this machine's baseline, which pytest-benchmark keeps in .benchmarks
+#python Benchmarks.py then fails any benchmark whose median time is more than REGRESSIONTHRESHOLD percent above the baseline's
+#(the first run on a machine with no baseline saves one instead)
+#the benchmarks can also be run on their own with: python -m pytest Benchmarks.py
+
+import argparse
+import builtins
+import contextlib
+import glob
+import importlib.util
+import inspect
+import io
+import os
+import random
+import sys
+import pytest
+
+DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+STORAGEDIRECTORY = os.path.join(DIRECTORY, ".benchmarks")
+REGRESSIONTHRESHOLD = 50
+MAXSCRIPTEDINPUTS = 400
+SCRIPTSEED = 16
+
+VARIANTS = ["Original[READ_ONLY].py", "CircQueue.py", "ReduceMoveOptionCreation.py", "MovingKotla.py", "UndoMove.py"] + sorted(os.path.relpath(Path, DIRECTORY).replace(os.sep, "/") for Path in glob.glob(os.path.join(DIRECTORY, "ZigZag", "*.py")))
+
+_Modules = {}
+
+class ScriptEnded(Exception):
+    pass
+
+class ScriptedInput:
+    # Stands in for input() with random but repeatable answers to each kind of
+    # prompt the variants ask, ending the game after MaxInputs answers.
+    def __init__(self, Seed, MaxInputs=MAXSCRIPTEDINPUTS):
+        self.__Random = random.Random(Seed)
+        self.__MaxInputs = MaxInputs
+        self.__NoOfInputs = 0
+
+    def GetNoOfInputs(self):
+        return self.__NoOfInputs
+
+    def __call__(self, Prompt=""):
+        self.__NoOfInputs += 1
+        if self.__NoOfInputs > self.__MaxInputs:
+            raise ScriptEnded()
+        if "Y/N" in Prompt:
+            return self.__Random.choice(["Y", "N"])
+        elif "replace" in Prompt:
+            return str(self.__Random.randint(1, 5))
+        elif "option" in Prompt:
+            return self.__Random.choice(["1", "2", "3", "9"])
+        elif "square" in Prompt:
+            return str(self.__Random.randint(1, 6) * 10 + self.__Random.randint(1, 6))
+        return str(self.__Random.randint(1, 3))
+
+@contextlib.contextmanager
+def Scripted(Seed):
+    # Runs a block with scripted input and everything printed thrown away.
+    OldInput = builtins.input
+    builtins.input = ScriptedInput(Seed)
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            yield builtins.input
+    finally:
+        builtins.input = OldInput
+
+def LoadVariant(Variant):
+    Module = _Modules.get(Variant)
+    if Module is None:
+        Spec = importlib.util.spec_from_file_location("Variant" + str(len(_Modules)), os.path.join(DIRECTORY, Variant))
+        Module = importlib.util.module_from_spec(Spec)
+        Spec.loader.exec_module(Module)
+        _Modules[Variant] = Module
+    return Module
+
+def CreateGame(Module, Seed=0):
+    # The read-only programs take no Seed, so the global random module is seeded for them.
+    with Scripted(Seed):
+        if "Seed" in inspect.signature(Module.Dastan.__init__).parameters:
+            return Module.Dastan(6, 6, 4, Seed=Seed)
+        random.seed(Seed)
+        return Module.Dastan(6, 6, 4)
+
+def GetSquareReferences(Game):
+    return [Row * 10 + Column for Row in range(1, Game._NoOfRows + 1) for Column in range(1, Game._NoOfColumns + 1)]
+
+def RunCheckSquareIsValid(Module, Game):
+    CheckSquareIsValid = Game._Dastan__CheckSquareIsValid
+    for SquareReference in GetSquareReferences(Game):
+        CheckSquareIsValid(SquareReference, True)
+        CheckSquareIsValid(SquareReference, False)
+
+def RunCheckPlayerMove(Module, Game):
+    SquareReferences = GetSquareReferences(Game)
+    for Choice in range(1, 4):
+        for StartSquareReference in SquareReferences:
+            for FinishSquareReference in SquareReferences:
+                Game._CurrentPlayer.CheckPlayerMove(Choice, StartSquareReference, FinishSquareReference)
+
+def RunCheckIfGameOver(Module, Game):
+    Game._Dastan__CheckIfGameOver()
+
+def RunGetPointsForOccupancyByPlayer(Module, Game):
+    Game._Dastan__GetPointsForOccupancyByPlayer(Game._CurrentPlayer)
+
+def RunDisplayBoard(Module, Game):
+    with contextlib.redirect_stdout(io.StringIO()):
+        Game._Dastan__DisplayBoard()
+
+def RunCreateMoveOption(Module, Game):
+    for Name in ("ryott", "chowkidar", "cuirassier", "faujdar", "jazair"):
+        Game._Dastan__CreateMoveOption(Name, 1)
+        Game._Dastan__CreateMoveOption(Name, -1)
+
+def RunScriptedGame(Module, Game):
+    # A whole game from a fresh board, with the same answers every time.
+    # Returns how many answers were given and how the game ended: "finished",
+    # "ScriptEnded" when the answers ran out, or the name of the error some
+    # variants' bugs raise, always at the same point for the same answers.
+    with Scripted(SCRIPTSEED) as Input:
+        try:
+            if "Seed" in inspect.signature(Module.Dastan.__init__).parameters:
+                NewGame = Module.Dastan(6, 6, 4, Seed=SCRIPTSEED)
+            else:
+                random.seed(SCRIPTSEED)
+                NewGame = Module.Dastan(6, 6, 4)
+            NewGame.PlayGame()
+            Ending = "finished"
+        except Exception as Error:
+            Ending = type(Error).__name__
+        return (Input.GetNoOfInputs(), Ending)
+
+BENCHMARKS = {
+    "CheckSquareIsValid": RunCheckSquareIsValid,
+    "CheckPlayerMove": RunCheckPlayerMove,
+    "CheckIfGameOver": RunCheckIfGameOver,
+    "GetPointsForOccupancyByPlayer": RunGetPointsForOccupancyByPlayer,
+    "DisplayBoard": RunDisplayBoard,
+    "CreateMoveOption": RunCreateMoveOption,
+    "ScriptedGame": RunScriptedGame,
+}
+
+# (answers given, ending) of each variant's scripted game with SCRIPTSEED, from
+# python Benchmarks.py --endings. zz_Task8 always stops at the same bug.
+SCRIPTEDGAMEENDINGS = {
+    "Original[READ_ONLY].py": (401, "ScriptEnded"),
+    "CircQueue.py": (401, "ScriptEnded"),
+    "ReduceMoveOptionCreation.py": (401, "ScriptEnded"),
+    "MovingKotla.py": (401, "ScriptEnded"),
+    "UndoMove.py": (401, "ScriptEnded"),
+    "ZigZag/C+D.py": (401, "ScriptEnded"),
+    "ZigZag/zz_Task1.py": (401, "ScriptEnded"),
+    "ZigZag/zz_Task11.py": (401, "ScriptEnded"),
+    "ZigZag/zz_Task3.py": (401, "ScriptEnded"),
+    "ZigZag/zz_Task4.py": (401, "ScriptEnded"),
+    "ZigZag/zz_Task5.py": (401, "ScriptEnded"),
+    "ZigZag/zz_Task6.py": (401, "ScriptEnded"),
+    "ZigZag/zz_Task7.py": (401, "ScriptEnded"),
+    "ZigZag/zz_Task8.py": (33, "UnboundLocalError"),
+    "ZigZag/zz_Task9.py": (401, "ScriptEnded"),
+}
+
+@pytest.mark.skipif(importlib.util.find_spec("pytest_benchmark") is None, reason="needs pytest-benchmark")
+@pytest.mark.parametrize("Name", list(BENCHMARKS))
+@pytest.mark.parametrize("Variant", VARIANTS)
+def test_hot_path(benchmark, Variant, Name):
+    # A scripted game that ends differently would time different work, so the
+    # answers given and the way it ended must match SCRIPTEDGAMEENDINGS too.
+    Module = LoadVariant(Variant)
+    Game = CreateGame(Module)
+    Function = BENCHMARKS[Name]
+    benchmark.group = Name
+    Result = benchmark(Function, Module, Game)
+    if Name == "ScriptedGame":
+        assert Result == SCRIPTEDGAMEENDINGS.get(Variant), Variant + " scripted game ended with " + str(Result) + ", expected " + str(SCRIPTEDGAMEENDINGS.get(Variant))
+
+def Main():
+    Parser = argparse.ArgumentParser(description="Benchmark the hot paths of each Dastan variant against this machine's baseline.")
+    Parser.add_argument("--save", action="store_true", help="store this run as the baseline instead of comparing with it")
+    Parser.add_argument("--threshold", type=int, default=REGRESSIONTHRESHOLD, help="percentage slowdown of the median that counts as a regression")
+    Parser.add_argument("--endings", action="store_true", help="print how each variant's scripted game ends, for SCRIPTEDGAMEENDINGS")
+    Args = Parser.parse_args()
+    if Args.endings:
+        for Variant in VARIANTS:
+            Module = LoadVariant(Variant)
+            print(repr(Variant) + ": " + repr(RunScriptedGame(Module, None)) + ",")
+        return
+    Options = [os.path.abspath(__file__), "-q", "--benchmark-columns=min,median,mean,rounds", "--benchmark-storage=file://" + STORAGEDIRECTORY]
+    if not Args.save and not glob.glob(os.path.join(STORAGEDIRECTORY, "*", "*.json")):
+        print("No baseline has been saved on this machine yet, so this run will be saved as the baseline to compare later runs with.")
+        Args.save = True
+    if Args.save:
+        Options.append("--benchmark-save=baseline")
+    else:
+        Options += ["--benchmark-compare", "--benchmark-compare-fail=median:" + str(Args.threshold) + "%"]
+    sys.exit(pytest.main(Options))
+
+if __name__ == "__main__":
+    Main()
@@ -12,7 +12,8 @@ import random
 
 class Dastan:
     # Encapsulation (information hiding)
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # each game has its own random number generator, pass a Seed to replay the same offers
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = [] # MoveOption Offer queue for BOTH Players (both players use the same queue)
@@ -169,7 +170,7 @@ class Dastan:
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
         # MoveOptionOfferPosition is updated, with a random number between 0 to 4 to get a new move
         # Currently the Player can use as many new move options as they want per turn... Keep this in mind for a potential Section D question
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         # Calculate total points for any squres occupied by the CurrentPlayer
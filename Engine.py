@@ -0,0 +1,1037 @@
+#Skeleton Program code for the AQA A Level Paper 1 Summer 2023 examination
+#this code should be used in conjunction with the Preliminary Material
+#written by the AQA Programmer Team
+#developed in the Python 3.9 programming environment
+
+# Headless engine version of the skeleton program. The game rules are the same
+# as the original, but a game can also be driven from code (for bots, search and
+# self-play) through legal_moves(), apply(), take_offer(), is_terminal() and
+# scores() without ever reading from stdin or printing to stdout.
+# python Engine.py --check checks that copied and pickled games replay exactly.
+
+import copy # CODE ADDED
+import pickle # CODE ADDED
+import random
+import sys # CODE ADDED
+
+# ADDED CODE STARTS
+_ZobristKeys = {}
+
+def GetZobristKey(*Parts):
+    # Seeding from the parts themselves makes every key the same in every
+    # process, so hashes can be compared between runs and workers.
+    Key = _ZobristKeys.get(Parts)
+    if Key is None:
+        Key = random.Random(repr(Parts)).getrandbits(64)
+        _ZobristKeys[Parts] = Key
+    return Key
+
+class RandomStream(random.Random):
+    # A random.Random that remembers its seed and can hand out any number of
+    # child streams. A child's seed depends only on the parent's seed and how
+    # many children came before it, never on how much the parent has been used.
+    def __init__(self, Seed=None):
+        if Seed is None:
+            Seed = random.SystemRandom().getrandbits(64)
+        super(RandomStream, self).__init__(Seed)
+        self.__Seed = Seed
+        self.__NoOfSpawned = 0
+
+    def GetSeed(self):
+        return self.__Seed
+
+    def Spawn(self):
+        self.__NoOfSpawned += 1
+        return RandomStream(random.Random(repr((self.__Seed, self.__NoOfSpawned))).getrandbits(64))
+
+    # random.Random pickles and copies as a new stream with a fresh seed and only
+    # the generator state put back, so the seed and spawn count are carried too.
+    def __reduce__(self):
+        return (self.__class__, (self.__Seed,), (self.getstate(), self.__NoOfSpawned))
+
+    def __setstate__(self, State):
+        self.setstate(State[0])
+        self.__NoOfSpawned = State[1]
+
+# The (RowChange, ColumnChange) of each move option for Player One (direction 1),
+# in the same order as the __Create...MoveOption methods add them. Player Two's
+# changes are these multiplied by -1. The last two are from the variant programs.
+# Sahm and ForwardBound slide along a ray until something stops them, so they
+# have no fixed changes and are not here.
+MOVEOPTIONDELTAS = {
+    "ryott": ((0, 1), (0, -1), (1, 0), (-1, 0)),
+    "faujdar": ((0, -1), (0, 1), (0, 2), (0, -2)),
+    "jazair": ((2, 0), (2, -2), (2, 2), (0, 2), (0, -2), (-1, -1), (-1, 1)),
+    "cuirassier": ((1, 0), (2, 0), (1, -2), (1, 2)),
+    "chowkidar": ((1, 1), (1, -1), (-1, 1), (-1, -1), (0, 2), (0, -2)),
+    "sarukh": ((0, 1), (0, -1), (1, 1), (1, -1), (2, 0)),
+    "tibblecross": ((2, 2), (-2, 2), (2, -2), (-2, -2)),
+}
+
+MOVEOPTIONNAMES = tuple(MOVEOPTIONDELTAS)
+
+_MoveOptions = {}
+
+def GetMoveOption(Name, Direction):
+    # The shared, frozen MoveOption for Name and Direction, made on first use.
+    AMoveOption = _MoveOptions.get((Name, Direction))
+    if AMoveOption is None:
+        AMoveOption = MoveOption(Name)
+        for RowChange, ColumnChange in MOVEOPTIONDELTAS[Name]:
+            AMoveOption.AddToPossibleMoves(Move(RowChange * Direction, ColumnChange * Direction))
+        AMoveOption.Freeze()
+        _MoveOptions[(Name, Direction)] = AMoveOption
+    return AMoveOption
+
+_MoveTables = {}
+
+def GetMoveTables(R, C):
+    # One MoveTables per board size, shared by every game of that size.
+    Tables = _MoveTables.get((R, C))
+    if Tables is None:
+        Tables = MoveTables(R, C)
+        _MoveTables[(R, C)] = Tables
+    return Tables
+
+_PieceKeys = {}
+
+def GetPieceKeys(R, C):
+    # The Zobrist key of each player's piece types on each square, indexed
+    # [PlayerIndex][TypeIndex][Index], shared by every board of the same size.
+    Keys = _PieceKeys.get((R, C))
+    if Keys is None:
+        Keys = tuple(tuple(tuple(GetZobristKey("piece", PlayerIndex, TypeOfPiece, Index) for Index in range(R * C)) for TypeOfPiece in BitBoard.PieceTypes) for PlayerIndex in range(2))
+        _PieceKeys[(R, C)] = Keys
+    return Keys
+# ADDED CODE ENDS
+
+class Dastan:
+    def __init__(self, R, C, NoOfPieces, Seed=None, Rng=None):
+        # CODE ADDED STARTS
+        # All of a game's randomness comes from its own stream, so games can run
+        # side by side and the same Seed (or Rng) replays a game exactly. The
+        # stream's generator state is large, so it is only made from the seed
+        # when the game first needs a random number.
+        if Rng is None and Seed is None:
+            Seed = random.SystemRandom().getrandbits(64)
+        self._RandomSeed = Seed
+        self._Random = Rng
+        # CODE ADDED ENDS
+        self._Board = []
+        self._Players = []
+        self._MoveOptionOffer = []
+        self._Players.append(Player("Player One", 1))
+        self._Players.append(Player("Player Two", -1))
+        self.__CreateMoveOptions()
+        self._NoOfRows = R
+        self._NoOfColumns = C
+        self._MoveOptionOfferPosition = 0
+        self._StateHash = GetZobristKey("offer", 0)
+        self._BitBoard = BitBoard(R, C)
+        self._MoveTables = GetMoveTables(R, C)
+        self.__CreateMoveOptionOffer()
+        self.__CreateBoard()
+        self.__CreatePieces(NoOfPieces)
+        self._CurrentPlayer = self._Players[0]
+
+    def __DisplayBoard(self):
+        print(self.GetBoardAsString(), end="") # CODE EDITED
+
+    # ADDED CODE STARTS
+    def GetBoardAsString(self):
+        # The board exactly as __DisplayBoard shows it, built up in a list and
+        # joined once, so that displaying it is a single write.
+        Lines = ["\n" + "   " + "".join(str(Column) + "  " for Column in range(1, self._NoOfColumns + 1))]
+        Lines.append("  " + "---" * self._NoOfColumns + "-")
+        for Row in range(1, self._NoOfRows + 1):
+            Cells = [str(Row) + " "]
+            for Column in range(1, self._NoOfColumns + 1):
+                ASquare = self._Board[self.__GetIndexOfSquare(Row * 10 + Column)]
+                PieceInSquare = ASquare.GetPieceInSquare()
+                if PieceInSquare is None:
+                    Cells.append("|" + ASquare.GetSymbol() + " ")
+                else:
+                    Cells.append("|" + ASquare.GetSymbol() + PieceInSquare.GetSymbol())
+            Cells.append("|")
+            Lines.append("".join(Cells))
+        Lines.append("  -" + "---" * self._NoOfColumns)
+        return "\n".join(Lines) + "\n\n"
+    # ADDED CODE ENDS
+
+    def __DisplayState(self):
+        self.__DisplayBoard()
+        print("Move option offer: " + self._MoveOptionOffer[self._MoveOptionOfferPosition])
+        print()
+        print(self._CurrentPlayer.GetPlayerStateAsString())
+        print("Turn: " + self._CurrentPlayer.GetName())
+        print()
+
+    def __GetIndexOfSquare(self, SquareReference):
+        Row = SquareReference // 10
+        Col = SquareReference % 10
+        return (Row - 1) * self._NoOfColumns + (Col - 1)
+
+    def __CheckSquareInBounds(self, SquareReference):
+        Row = SquareReference // 10
+        Col = SquareReference % 10
+        if Row < 1 or Row > self._NoOfRows:
+            return False
+        elif Col < 1 or Col > self._NoOfColumns:
+            return False
+        else:
+            return True
+
+    # CODE EDITED STARTS
+    def __GetPlayerIndex(self, APlayer):
+        return self.__GetIndexOfPlayerId(APlayer.GetId())
+
+    def __GetIndexOfPlayerId(self, PlayerId):
+        # Player One (id 1) is index 0 and Player Two (id -1) is index 1.
+        return (1 - PlayerId) // 2
+
+    def __CheckSquareIsValid(self, SquareReference, StartSquare):
+        if not self.__CheckSquareInBounds(SquareReference):
+            return False
+        OwnPiece = self._BitBoard.IsOccupiedBy(self.__GetIndexOfSquare(SquareReference), self.__GetPlayerIndex(self._CurrentPlayer))
+        if StartSquare:
+            return OwnPiece
+        else:
+            return not OwnPiece
+
+    def __CheckIfGameOver(self):
+        return self._BitBoard.CheckIfGameOver()
+    # CODE EDITED ENDS
+
+    def __GetSquareReference(self, Description):
+        SelectedSquare = int(input("Enter the square " + Description + " (row number followed by column number): "))
+        return SelectedSquare
+
+    def __UseMoveOptionOffer(self):
+        ReplaceChoice = int(input("Choose the move option from your queue to replace (1 to 5): "))
+        # CODE EDITED STARTS
+        # Through take_offer, so rule variants that limit offers apply here too.
+        try:
+            self.take_offer(ReplaceChoice)
+        except ValueError as Error:
+            print(str(Error))
+        # CODE EDITED ENDS
+
+    # ADDED CODE STARTS
+    def __TakeMoveOptionOffer(self, ReplaceChoice, NewOfferPosition=None):
+        self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
+        self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
+        if NewOfferPosition is None:
+            NewOfferPosition = self.GetRandom().randint(0, 4)
+        self.__SetMoveOptionOfferPosition(NewOfferPosition)
+
+    def __SetMoveOptionOfferPosition(self, Position):
+        self._StateHash ^= GetZobristKey("offer", self._MoveOptionOfferPosition) ^ GetZobristKey("offer", Position)
+        self._MoveOptionOfferPosition = Position
+    # ADDED CODE ENDS
+
+    def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
+        return self._BitBoard.GetPointsForOccupancy(self.__GetPlayerIndex(CurrentPlayer)) # CODE EDITED
+
+    def __UpdatePlayerScore(self, PointsForPieceCapture):
+        self._CurrentPlayer.ChangeScore(self.__GetPointsForOccupancyByPlayer(self._CurrentPlayer) + PointsForPieceCapture)
+
+    def __CalculatePieceCapturePoints(self, FinishSquareReference):
+        return self._BitBoard.GetPointsIfCaptured(self.__GetIndexOfSquare(FinishSquareReference)) # CODE EDITED
+
+    def PlayGame(self, ComputerPlayers=None):
+        # ComputerPlayers maps a player index (0 or 1) to a bot with a ChooseMove(Game) method.
+        if ComputerPlayers is None:
+            ComputerPlayers = {}
+        GameOver = False
+        while not GameOver:
+            self.__DisplayState()
+            # CODE ADDED STARTS
+            if self.__GetPlayerIndex(self._CurrentPlayer) in ComputerPlayers:
+                self.__PlayComputerTurn(ComputerPlayers[self.__GetPlayerIndex(self._CurrentPlayer)])
+                self.__ChangeCurrentPlayer()
+                GameOver = self.is_terminal()
+                continue
+            # CODE ADDED ENDS
+            SquareIsValid = False
+            Choice = 0
+            while Choice < 1 or Choice > 3:
+                Choice = int(input("Choose move option to use from queue (1 to 3) or 9 to take the offer: "))
+                if Choice == 9:
+                    self.__UseMoveOptionOffer()
+                    self.__DisplayState()
+            while not SquareIsValid:
+                StartSquareReference = self.__GetSquareReference("containing the piece to move")
+                SquareIsValid = self.__CheckSquareIsValid(StartSquareReference, True)
+            SquareIsValid = False
+            while not SquareIsValid:
+                FinishSquareReference = self.__GetSquareReference("to move to")
+                SquareIsValid = self.__CheckSquareIsValid(FinishSquareReference, False)
+            MoveLegal = self.__CheckPlayerMove(Choice, StartSquareReference, FinishSquareReference) # CODE EDITED
+            if MoveLegal:
+                self.__MakePlayerMove(Choice, StartSquareReference, FinishSquareReference)
+                print("New score: " + str(self._CurrentPlayer.GetScore()) + "\n")
+            self.__ChangeCurrentPlayer()
+            GameOver = self.is_terminal() # CODE EDITED
+        self.__DisplayState()
+        self.__DisplayFinalResult()
+
+    # ADDED CODE STARTS
+    def __PlayComputerTurn(self, ComputerPlayer):
+        Move, OfferSlot = ComputerPlayer.ChooseMove(self)
+        if OfferSlot:
+            print("Computer takes the offer into queue position " + str(OfferSlot))
+            self.take_offer(OfferSlot)
+        if Move is None:
+            print("Computer has no legal move\n")
+        else:
+            print("Computer uses move option " + str(Move[0]) + " from " + str(Move[1]) + " to " + str(Move[2]))
+            self.__MakePlayerMove(Move[0], Move[1], Move[2])
+            print("New score: " + str(self._CurrentPlayer.GetScore()) + "\n")
+
+    def __MakePlayerMove(self, Choice, StartSquareReference, FinishSquareReference):
+        PointsForPieceCapture = self.__CalculatePieceCapturePoints(FinishSquareReference)
+        self._CurrentPlayer.ChangeScore(-(Choice + (2 * (Choice - 1))))
+        self._CurrentPlayer.UpdateQueueAfterMove(Choice)
+        self.__UpdateBoard(StartSquareReference, FinishSquareReference)
+        self.__UpdatePlayerScore(PointsForPieceCapture)
+
+    def __ChangeCurrentPlayer(self):
+        if self._CurrentPlayer.SameAs(self._Players[0]):
+            self._CurrentPlayer = self._Players[1]
+        else:
+            self._CurrentPlayer = self._Players[0]
+        self._StateHash ^= GetZobristKey("side")
+
+    def GetCurrentPlayer(self):
+        return self._CurrentPlayer
+
+    def legal_moves(self):
+        # Every (Choice, StartSquareReference, FinishSquareReference) the current
+        # player could enter in PlayGame that CheckPlayerMove would accept.
+        return self.GenerateLegalMoves(self._CurrentPlayer)
+
+    def GenerateLegalMoves(self, APlayer):
+        Moves = []
+        Queue = APlayer.GetQueue()
+        for Choice in range(1, 4):
+            self.__AddMovesForMoveOption(Moves, APlayer, Queue.GetMoveOptionInPosition(Choice - 1), Choice)
+        return Moves
+
+    def GenerateOfferMoves(self, APlayer):
+        # The moves APlayer could make by taking the current offer into queue
+        # position Slot (1 to 3) and then choosing that position, as (Slot, Start, Finish).
+        Moves = []
+        Offer = self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], APlayer.GetDirection())
+        for Slot in range(1, 4):
+            self.__AddMovesForMoveOption(Moves, APlayer, Offer, Slot)
+        return Moves
+
+    def __AddMovesForMoveOption(self, Moves, APlayer, AMoveOption, Choice):
+        OwnPieces = self._BitBoard.GetOccupiedBy(self.__GetPlayerIndex(APlayer))
+        SquareReferences = self._MoveTables.GetSquareReferences()
+        Pieces = OwnPieces
+        while Pieces:
+            Bit = Pieces & -Pieces
+            Pieces ^= Bit
+            Index = Bit.bit_length() - 1
+            Reachable = self.__GetReachableSquares(APlayer, AMoveOption, Index)
+            while Reachable:
+                FinishBit = Reachable & -Reachable
+                Reachable ^= FinishBit
+                Moves.append((Choice, SquareReferences[Index], SquareReferences[FinishBit.bit_length() - 1]))
+
+    def ReachableSquares(self, Choice, StartSquareReference):
+        # Bitmask of the square indexes the current player's piece on StartSquareReference
+        # could move to using move option Choice, leaving out squares holding their own
+        # pieces. Move generation and move checking both come down to this.
+        AMoveOption = self._CurrentPlayer.GetQueue().GetMoveOptionInPosition(Choice - 1)
+        return self.__GetReachableSquares(self._CurrentPlayer, AMoveOption, self.__GetIndexOfSquare(StartSquareReference))
+
+    def GetReachableSquareReferences(self, Choice, StartSquareReference):
+        # ReachableSquares as a list of square references, for showing to a player.
+        Reachable = self.ReachableSquares(Choice, StartSquareReference)
+        SquareReferences = self._MoveTables.GetSquareReferences()
+        return [SquareReferences[Index] for Index in range(len(SquareReferences)) if Reachable >> Index & 1]
+
+    def __GetReachableSquares(self, APlayer, AMoveOption, StartIndex):
+        TargetMasks = self._MoveTables.GetTargetMasks(AMoveOption.GetName(), APlayer.GetDirection())
+        return TargetMasks[StartIndex] & ~self._BitBoard.GetOccupiedBy(self.__GetPlayerIndex(APlayer))
+
+    def __CheckPlayerMove(self, Choice, StartSquareReference, FinishSquareReference):
+        # Same answer as Player.CheckPlayerMove for a finish square on the board
+        # that does not hold one of the player's own pieces.
+        return self.ReachableSquares(Choice, StartSquareReference) >> self.__GetIndexOfSquare(FinishSquareReference) & 1 == 1
+
+    def apply(self, Move):
+        # Plays one turn. Move is a (Choice, StartSquareReference, FinishSquareReference)
+        # tuple; as in PlayGame an illegal move (or None) forfeits the turn.
+        if Move is not None:
+            Choice, StartSquareReference, FinishSquareReference = Move
+            if Choice < 1 or Choice > 3:
+                raise ValueError("Choice must be between 1 and 3, got " + str(Choice))
+            if not self.__CheckSquareIsValid(StartSquareReference, True):
+                raise ValueError("Invalid start square " + str(StartSquareReference))
+            if not self.__CheckSquareIsValid(FinishSquareReference, False):
+                raise ValueError("Invalid finish square " + str(FinishSquareReference))
+            if self.__CheckPlayerMove(Choice, StartSquareReference, FinishSquareReference):
+                self.__MakePlayerMove(Choice, StartSquareReference, FinishSquareReference)
+        self.__ChangeCurrentPlayer()
+
+    def take_offer(self, Slot):
+        # Same as choosing 9 in PlayGame; Slot is the queue position to replace (1 to 5).
+        if Slot < 1 or Slot > 5:
+            raise ValueError("Slot must be between 1 and 5, got " + str(Slot))
+        self.__TakeMoveOptionOffer(Slot)
+
+    def is_terminal(self):
+        return self.__CheckIfGameOver()
+
+    def scores(self):
+        return (self._Players[0].GetScore(), self._Players[1].GetScore())
+
+    def GetBitBoard(self):
+        return self._BitBoard
+
+    def GetRandom(self):
+        if self._Random is None:
+            self._Random = RandomStream(self._RandomSeed)
+        return self._Random
+
+    def SpawnRandom(self):
+        # An independent stream for something that belongs to this game, such as a bot.
+        return self.GetRandom().Spawn()
+
+    def GetMoveOptionOfferPosition(self):
+        return self._MoveOptionOfferPosition
+
+    def GetMirzaSquare(self, APlayer):
+        # Square reference of the player's mirza, or None if it has been captured.
+        Index = self._BitBoard.GetMirzaSquare(self.__GetPlayerIndex(APlayer))
+        if Index is None:
+            return None
+        return (Index // self._NoOfColumns + 1) * 10 + Index % self._NoOfColumns + 1
+
+    def GetCapturePoints(self, FinishSquareReference):
+        return self.__CalculatePieceCapturePoints(FinishSquareReference)
+
+    def GetHash(self):
+        # 64-bit Zobrist hash of the pieces, kotlas, both move option queues,
+        # the offer position and the side to move.
+        return self._StateHash ^ self._BitBoard.GetHash() ^ self._Players[0].GetQueue().GetHash() ^ self._Players[1].GetQueue().GetHash()
+
+    def GetSearchKey(self):
+        # GetHash with both scores mixed in, for searches whose values depend on
+        # the scores: the same position can be reached with different scores.
+        return self.GetHash() ^ GetZobristKey("score", 0, self._Players[0].GetScore()) ^ GetZobristKey("score", 1, self._Players[1].GetScore())
+
+    def make_move(self, Move, OfferSlot=0, NewOfferPosition=None):
+        # Plays a move from GenerateLegalMoves (or None to pass), optionally taking
+        # the offer into queue position OfferSlot first, and returns the undo record
+        # (Move, captured piece, prior score, OfferSlot, replaced move option, prior
+        # offer position) that unmake_move needs to put everything back.
+        PriorScore = self._CurrentPlayer.GetScore()
+        PriorOfferPosition = self._MoveOptionOfferPosition
+        ReplacedMoveOption = None
+        if OfferSlot:
+            ReplacedMoveOption = self._CurrentPlayer.GetQueue().GetMoveOptionInPosition(OfferSlot - 1)
+            self.__TakeMoveOptionOffer(OfferSlot, NewOfferPosition)
+        Captured = None
+        if Move is not None:
+            Captured = self._Board[self.__GetIndexOfSquare(Move[2])].GetPieceInSquare()
+            self.__MakePlayerMove(Move[0], Move[1], Move[2])
+        self.__ChangeCurrentPlayer()
+        return (Move, Captured, PriorScore, OfferSlot, ReplacedMoveOption, PriorOfferPosition)
+
+    def unmake_move(self, Undo):
+        Move, Captured, PriorScore, OfferSlot, ReplacedMoveOption, PriorOfferPosition = Undo
+        self.__ChangeCurrentPlayer()
+        if Move is not None:
+            Choice, StartSquareReference, FinishSquareReference = Move
+            self.__UpdateBoard(FinishSquareReference, StartSquareReference)
+            if Captured is not None:
+                self.__PlacePiece(FinishSquareReference, Captured)
+            self._CurrentPlayer.UndoQueueAfterMove(Choice)
+        if OfferSlot:
+            self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(OfferSlot - 1, ReplacedMoveOption)
+        self._CurrentPlayer.ChangeScore(PriorScore - self._CurrentPlayer.GetScore())
+        self.__SetMoveOptionOfferPosition(PriorOfferPosition)
+    # ADDED CODE ENDS
+
+    def __UpdateBoard(self, StartSquareReference, FinishSquareReference):
+        self._Board[self.__GetIndexOfSquare(FinishSquareReference)].SetPiece(self._Board[self.__GetIndexOfSquare(StartSquareReference)].RemovePiece())
+        self._BitBoard.MovePiece(self.__GetIndexOfSquare(StartSquareReference), self.__GetIndexOfSquare(FinishSquareReference)) # CODE ADDED
+
+    def __DisplayFinalResult(self):
+        if self._Players[0].GetScore() == self._Players[1].GetScore():
+            print("Draw!")
+        elif self._Players[0].GetScore() > self._Players[1].GetScore():
+            print(self._Players[0].GetName() + " is the winner!")
+        else:
+            print(self._Players[1].GetName() + " is the winner!")
+
+    def __CreateBoard(self):
+        for Row in range(1, self._NoOfRows + 1):
+            for Column in range(1, self._NoOfColumns + 1):
+                if Row == 1 and Column == self._NoOfColumns // 2:
+                    S = Kotla(self._Players[0].GetId(), "K")
+                    self._BitBoard.SetKotla(len(self._Board), 0) # CODE ADDED
+                elif Row == self._NoOfRows and Column == self._NoOfColumns // 2 + 1:
+                    S = Kotla(self._Players[1].GetId(), "k")
+                    self._BitBoard.SetKotla(len(self._Board), 1) # CODE ADDED
+                else:
+                    S = Square()
+                self._Board.append(S)
+
+    def __CreatePieces(self, NoOfPieces):
+        for Count in range(1, NoOfPieces + 1):
+            CurrentPiece = Piece("piece", self._Players[0].GetId(), 1, "!")
+            self.__PlacePiece(2 * 10 + Count + 1, CurrentPiece)
+        CurrentPiece = Piece("mirza", self._Players[0].GetId(), 5, "1")
+        self.__PlacePiece(10 + self._NoOfColumns // 2, CurrentPiece)
+        for Count in range(1, NoOfPieces + 1):
+            CurrentPiece = Piece("piece", self._Players[1].GetId(), 1, '"')
+            self.__PlacePiece((self._NoOfRows - 1) * 10 + Count + 1, CurrentPiece)
+        CurrentPiece = Piece("mirza", self._Players[1].GetId(), 5, "2")
+        self.__PlacePiece(self._NoOfRows * 10 + (self._NoOfColumns // 2 + 1), CurrentPiece)
+
+    # ADDED CODE STARTS
+    def __PlacePiece(self, SquareReference, P):
+        Index = self.__GetIndexOfSquare(SquareReference)
+        self._Board[Index].SetPiece(P)
+        self._BitBoard.SetPiece(Index, self.__GetIndexOfPlayerId(P.GetBelongsTo()), P.GetTypeOfPiece())
+    # ADDED CODE ENDS
+
+    def __CreateMoveOptionOffer(self):
+        self._MoveOptionOffer.append("jazair")
+        self._MoveOptionOffer.append("chowkidar")
+        self._MoveOptionOffer.append("cuirassier")
+        self._MoveOptionOffer.append("ryott")
+        self._MoveOptionOffer.append("faujdar")
+
+    def __CreateMoveOption(self, Name, Direction):
+        # CODE EDITED STARTS
+        # Move options never change once made, so every game shares one per name and direction.
+        return GetMoveOption(Name, Direction)
+        # CODE EDITED ENDS
+
+    def __CreateMoveOptions(self):
+        self._Players[0].AddToMoveOptionQueue(self.__CreateMoveOption("ryott", 1))
+        self._Players[0].AddToMoveOptionQueue(self.__CreateMoveOption("chowkidar", 1))
+        self._Players[0].AddToMoveOptionQueue(self.__CreateMoveOption("cuirassier", 1))
+        self._Players[0].AddToMoveOptionQueue(self.__CreateMoveOption("faujdar", 1))
+        self._Players[0].AddToMoveOptionQueue(self.__CreateMoveOption("jazair", 1))
+        self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("ryott", -1))
+        self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("chowkidar", -1))
+        self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("jazair", -1))
+        self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("faujdar", -1))
+        self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("cuirassier", -1))
+
+class Piece:
+    __slots__ = ("_TypeOfPiece", "_BelongsTo", "_PointsIfCaptured", "_Symbol") # CODE ADDED
+
+    def __init__(self, T, B, P, S):
+        self._TypeOfPiece = T
+        self._BelongsTo = B
+        self._PointsIfCaptured = P
+        self._Symbol = S
+
+    def GetSymbol(self):
+        return self._Symbol
+
+    def GetTypeOfPiece(self):
+        return self._TypeOfPiece
+
+    def GetBelongsTo(self):
+        return self._BelongsTo
+
+    def GetPointsIfCaptured(self):
+        return self._PointsIfCaptured
+
+class Square:
+    __slots__ = ("_PieceInSquare", "_BelongsTo", "_Symbol") # CODE ADDED
+
+    def __init__(self):
+        self._PieceInSquare = None
+        self._BelongsTo = None
+        self._Symbol = " "
+
+    def SetPiece(self, P):
+        self._PieceInSquare = P
+
+    def RemovePiece(self):
+        PieceToReturn = self._PieceInSquare
+        self._PieceInSquare = None
+        return PieceToReturn
+
+    def GetPieceInSquare(self):
+        return self._PieceInSquare
+
+    def GetSymbol(self):
+        return self._Symbol
+
+    def GetPointsForOccupancy(self, CurrentPlayer):
+        return 0
+
+    def GetBelongsTo(self):
+        return self._BelongsTo
+
+    def ContainsKotla(self):
+        if self._Symbol == "K" or self._Symbol == "k":
+            return True
+        else:
+            return False
+
+class Kotla(Square):
+    __slots__ = () # CODE ADDED
+
+    def __init__(self, P, S):
+        super(Kotla, self).__init__()
+        self._BelongsTo = P
+        self._Symbol = S
+
+    def GetPointsForOccupancy(self, CurrentPlayer):
+        if self._PieceInSquare is None:
+            return 0
+        elif self._BelongsTo == CurrentPlayer.GetId():
+            if CurrentPlayer.GetId() == self._PieceInSquare.GetBelongsTo() and (self._PieceInSquare.GetTypeOfPiece() == "piece" or self._PieceInSquare.GetTypeOfPiece() == "mirza"):
+                return 5
+            else:
+                return 0
+        else:
+            if CurrentPlayer.GetId() == self._PieceInSquare.GetBelongsTo() and (self._PieceInSquare.GetTypeOfPiece() == "piece" or self._PieceInSquare.GetTypeOfPiece() == "mirza"):
+                return 1
+            else:
+                return 0
+
+# ADDED CODE STARTS
+class BitBoard:
+    # Each square index (as returned by __GetIndexOfSquare) is one bit, so a set
+    # of squares is a single int. Python ints have no fixed width, so any R x C works.
+    PieceTypes = ("piece", "mirza")
+    PointsIfCaptured = (1, 5)
+
+    def __init__(self, R, C):
+        self._NoOfRows = R
+        self._NoOfColumns = C
+        self._Pieces = [[0, 0], [0, 0]]
+        self._Kotlas = [0, 0]
+        self._KotlaSquares = [None, None]
+        self._MirzaSquares = [None, None]
+        self._Hash = 0
+        self._PieceKeys = GetPieceKeys(R, C)
+
+    def GetNoOfSquares(self):
+        return self._NoOfRows * self._NoOfColumns
+
+    def GetHash(self):
+        return self._Hash
+
+    def SetKotla(self, Index, PlayerIndex):
+        self._Kotlas[PlayerIndex] |= 1 << Index
+        self._KotlaSquares[PlayerIndex] = Index
+        self._Hash ^= GetZobristKey("kotla", PlayerIndex, Index)
+
+    def MoveKotla(self, PlayerIndex, NewIndex):
+        # For variants where a kotla changes square during the game.
+        OldIndex = self._KotlaSquares[PlayerIndex]
+        if OldIndex is not None:
+            self._Kotlas[PlayerIndex] &= ~(1 << OldIndex)
+            self._Hash ^= GetZobristKey("kotla", PlayerIndex, OldIndex)
+        self.SetKotla(NewIndex, PlayerIndex)
+
+    def GetKotla(self, PlayerIndex):
+        return self._Kotlas[PlayerIndex]
+
+    def GetKotlaSquare(self, PlayerIndex):
+        return self._KotlaSquares[PlayerIndex]
+
+    def SetPiece(self, Index, PlayerIndex, TypeOfPiece):
+        TypeIndex = self.PieceTypes.index(TypeOfPiece)
+        self._Pieces[PlayerIndex][TypeIndex] |= 1 << Index
+        self._Hash ^= self._PieceKeys[PlayerIndex][TypeIndex][Index]
+        if TypeIndex == 1:
+            self._MirzaSquares[PlayerIndex] = Index
+
+    def GetPieceInSquare(self, Index):
+        Bit = 1 << Index
+        for PlayerIndex in range(2):
+            for TypeIndex in range(2):
+                if self._Pieces[PlayerIndex][TypeIndex] & Bit:
+                    return (PlayerIndex, self.PieceTypes[TypeIndex])
+        return None
+
+    def RemovePiece(self, Index):
+        PieceToReturn = self.GetPieceInSquare(Index)
+        if PieceToReturn is not None:
+            TypeIndex = self.PieceTypes.index(PieceToReturn[1])
+            self._Pieces[PieceToReturn[0]][TypeIndex] &= ~(1 << Index)
+            self._Hash ^= self._PieceKeys[PieceToReturn[0]][TypeIndex][Index]
+            if TypeIndex == 1 and self._MirzaSquares[PieceToReturn[0]] == Index:
+                self._MirzaSquares[PieceToReturn[0]] = None
+        return PieceToReturn
+
+    def MovePiece(self, StartIndex, FinishIndex):
+        # Returns the (PlayerIndex, TypeOfPiece) captured on the finish square, or None.
+        Captured = self.RemovePiece(FinishIndex)
+        Moved = self.RemovePiece(StartIndex)
+        if Moved is not None:
+            self.SetPiece(FinishIndex, Moved[0], Moved[1])
+        return Captured
+
+    def GetOccupied(self):
+        return self._Pieces[0][0] | self._Pieces[0][1] | self._Pieces[1][0] | self._Pieces[1][1]
+
+    def GetOccupiedBy(self, PlayerIndex):
+        return self._Pieces[PlayerIndex][0] | self._Pieces[PlayerIndex][1]
+
+    def GetMirza(self, PlayerIndex):
+        return self._Pieces[PlayerIndex][1]
+
+    def GetMirzaSquare(self, PlayerIndex):
+        # Index of the player's mirza, or None once it has been captured.
+        return self._MirzaSquares[PlayerIndex]
+
+    def IsOccupiedBy(self, Index, PlayerIndex):
+        return (self._Pieces[PlayerIndex][0] | self._Pieces[PlayerIndex][1]) >> Index & 1 == 1
+
+    def GetPointsIfCaptured(self, Index):
+        Bit = 1 << Index
+        for PlayerIndex in range(2):
+            for TypeIndex in range(2):
+                if self._Pieces[PlayerIndex][TypeIndex] & Bit:
+                    return self.PointsIfCaptured[TypeIndex]
+        return 0
+
+    def GetPointsForOccupancy(self, PlayerIndex):
+        # Only the two kotla squares can score, so only they are looked at.
+        OwnPieces = self._Pieces[PlayerIndex][0] | self._Pieces[PlayerIndex][1]
+        OwnKotla = self._KotlaSquares[PlayerIndex]
+        OtherKotla = self._KotlaSquares[1 - PlayerIndex]
+        Points = 0
+        if OwnKotla is not None and OwnPieces >> OwnKotla & 1:
+            Points += 5
+        if OtherKotla is not None and OwnPieces >> OtherKotla & 1:
+            Points += 1
+        return Points
+
+    def CheckIfGameOver(self):
+        # Over when a mirza has been captured or stands on the other player's kotla.
+        Player1Mirza = self._MirzaSquares[0]
+        Player2Mirza = self._MirzaSquares[1]
+        if Player1Mirza is None or Player2Mirza is None:
+            return True
+        return self._Kotlas[1] >> Player1Mirza & 1 == 1 or self._Kotlas[0] >> Player2Mirza & 1 == 1
+
+class MoveTables:
+    # For one board size, the squares each move option can reach from each
+    # square, worked out once so that move generation and checking never
+    # recompute row and column changes. Squares are BitBoard indexes. Tables
+    # for a move option and direction are built the first time they are asked for.
+    def __init__(self, R, C):
+        self._NoOfRows = R
+        self._NoOfColumns = C
+        self._SquareReferences = tuple((Index // C + 1) * 10 + Index % C + 1 for Index in range(R * C))
+        self._Targets = {}
+        self._TargetMasks = {}
+
+    def GetSquareReferences(self):
+        # The square reference of each index.
+        return self._SquareReferences
+
+    def GetTargets(self, Name, Direction):
+        # A tuple with, for each start index, the tuple of finish indexes on the board.
+        Key = (Name, Direction)
+        Targets = self._Targets.get(Key)
+        if Targets is None:
+            Targets = self.__BuildTargets(Name, Direction)
+            self._Targets[Key] = Targets
+        return Targets
+
+    def GetTargetMasks(self, Name, Direction):
+        # The same squares as GetTargets, with each start index's finish squares as one bitmask.
+        Key = (Name, Direction)
+        TargetMasks = self._TargetMasks.get(Key)
+        if TargetMasks is None:
+            TargetMasks = tuple(sum(1 << FinishIndex for FinishIndex in Targets) for Targets in self.GetTargets(Name, Direction))
+            self._TargetMasks[Key] = TargetMasks
+        return TargetMasks
+
+    def __BuildTargets(self, Name, Direction):
+        Deltas = MOVEOPTIONDELTAS[Name]
+        Targets = []
+        for Index in range(self._NoOfRows * self._NoOfColumns):
+            StartRow = Index // self._NoOfColumns + 1
+            StartColumn = Index % self._NoOfColumns + 1
+            FinishIndexes = []
+            for RowChange, ColumnChange in Deltas:
+                FinishRow = StartRow + RowChange * Direction
+                FinishColumn = StartColumn + ColumnChange * Direction
+                if FinishRow < 1 or FinishRow > self._NoOfRows or FinishColumn < 1 or FinishColumn > self._NoOfColumns:
+                    continue
+                FinishIndex = (FinishRow - 1) * self._NoOfColumns + FinishColumn - 1
+                if FinishIndex not in FinishIndexes:
+                    FinishIndexes.append(FinishIndex)
+            Targets.append(tuple(FinishIndexes))
+        return tuple(Targets)
+# ADDED CODE ENDS
+
+class MoveOption:
+    __slots__ = ("_Name", "_PossibleMoves", "_Frozen") # CODE ADDED
+
+    def __init__(self, N):
+        self._Name = N
+        self._PossibleMoves = []
+        self._Frozen = False
+
+    def AddToPossibleMoves(self, M):
+        if self._Frozen:
+            raise TypeError("Move option " + self._Name + " is shared and cannot be changed")
+        self._PossibleMoves.append(M)
+
+    def Freeze(self):
+        self._PossibleMoves = tuple(self._PossibleMoves)
+        self._Frozen = True
+
+    def GetName(self):
+        return self._Name
+
+    def GetPossibleMoves(self):
+        return self._PossibleMoves
+
+    def CheckIfThereIsAMoveToSquare(self, StartSquareReference, FinishSquareReference):
+        StartRow = StartSquareReference // 10
+        StartColumn = StartSquareReference % 10
+        FinishRow = FinishSquareReference // 10
+        FinishColumn = FinishSquareReference % 10
+        for M in self._PossibleMoves:
+            if StartRow + M.GetRowChange() == FinishRow and StartColumn + M.GetColumnChange() == FinishColumn:
+                return True
+        return False
+
+class Move:
+    __slots__ = ("_RowChange", "_ColumnChange") # CODE ADDED
+
+    def __init__(self, R, C):
+        self._RowChange = R
+        self._ColumnChange = C
+
+    def GetRowChange(self):
+        return self._RowChange
+
+    def GetColumnChange(self):
+        return self._ColumnChange
+
+class MoveOptionQueue:
+    # CODE EDITED STARTS
+    # A ring buffer of Capacity slots. Positions are counted from __Front, so
+    # when the queue is full moving an item to the back only shifts the items in
+    # front of it and then advances __Front, leaving the rest where they are.
+    # The order of the options is exactly as it was with a list.
+    def __init__(self, Owner=0, Capacity=5):
+        self.__Queue = [None] * Capacity
+        self.__Capacity = Capacity
+        self.__Front = 0
+        self.__Count = 0
+        self.__Owner = Owner
+        self.__Hash = 0
+
+    def GetQueueAsString(self):
+        QueueAsString = ""
+        Count = 1
+        for Position in range(self.__Count):
+            QueueAsString += str(Count) + ". " + self.GetMoveOptionInPosition(Position).GetName() + "   "
+            Count += 1
+        return QueueAsString
+
+    def Add(self, NewMoveOption):
+        if self.__Count == self.__Capacity:
+            raise IndexError("Move option queue is full")
+        self.__Queue[(self.__Front + self.__Count) % self.__Capacity] = NewMoveOption
+        self.__Count += 1
+        self.__Hash ^= self.__GetKey(self.__Count - 1)
+
+    def Replace(self, Position, NewMoveOption):
+        self.__Hash ^= self.__GetKey(Position)
+        self.__Queue[(self.__Front + Position) % self.__Capacity] = NewMoveOption
+        self.__Hash ^= self.__GetKey(Position)
+
+    def MoveItemToBack(self, Position):
+        self.__HashFrom(Position)
+        Queue = self.__Queue
+        Capacity = self.__Capacity
+        Front = self.__Front
+        Temp = Queue[(Front + Position) % Capacity]
+        if self.__Count == Capacity:
+            for Count in range(Position, 0, -1):
+                Queue[(Front + Count) % Capacity] = Queue[(Front + Count - 1) % Capacity]
+            Queue[Front] = Temp
+            self.__Front = (Front + 1) % Capacity
+        else:
+            for Count in range(Position, self.__Count - 1):
+                Queue[(Front + Count) % Capacity] = Queue[(Front + Count + 1) % Capacity]
+            Queue[(Front + self.__Count - 1) % Capacity] = Temp
+        self.__HashFrom(Position)
+
+    def GetMoveOptionInPosition(self, Pos):
+        return self.__Queue[(self.__Front + Pos) % self.__Capacity]
+
+    def GetCapacity(self):
+        return self.__Capacity
+
+    def GetLength(self):
+        return self.__Count
+
+    def GetEncoding(self):
+        # The whole queue as one int, 4 bits per position from the front, each
+        # holding 1 + the option's index in MOVEOPTIONNAMES.
+        Encoding = 0
+        for Position in range(self.__Count - 1, -1, -1):
+            Encoding = (Encoding << 4) | (MOVEOPTIONNAMES.index(self.GetMoveOptionInPosition(Position).GetName()) + 1)
+        return Encoding
+
+    def SetFromEncoding(self, Encoding, Direction):
+        # Refills the queue from GetEncoding's value, with the options for Direction.
+        self.__Queue = [None] * self.__Capacity
+        self.__Front = 0
+        self.__Count = 0
+        self.__Hash = 0
+        while Encoding:
+            self.Add(GetMoveOption(MOVEOPTIONNAMES[(Encoding & 15) - 1], Direction))
+            Encoding >>= 4
+    # CODE EDITED ENDS
+
+    # ADDED CODE STARTS
+    def MoveBackItemTo(self, Position):
+        # Undoes MoveItemToBack(Position).
+        self.__HashFrom(Position)
+        Queue = self.__Queue
+        Capacity = self.__Capacity
+        if self.__Count == Capacity:
+            Front = (self.__Front - 1) % Capacity
+            Temp = Queue[Front]
+            for Count in range(Position):
+                Queue[(Front + Count) % Capacity] = Queue[(Front + Count + 1) % Capacity]
+            self.__Front = Front
+        else:
+            Front = self.__Front
+            Temp = Queue[(Front + self.__Count - 1) % Capacity]
+            for Count in range(self.__Count - 1, Position, -1):
+                Queue[(Front + Count) % Capacity] = Queue[(Front + Count - 1) % Capacity]
+        Queue[(Front + Position) % Capacity] = Temp
+        self.__HashFrom(Position)
+
+    def GetHash(self):
+        return self.__Hash
+
+    def __GetKey(self, Position):
+        return GetZobristKey("queue", self.__Owner, Position, self.GetMoveOptionInPosition(Position).GetName())
+
+    def __HashFrom(self, Position):
+        # Toggles the keys of every option from Position to the back, which are
+        # the only ones whose position changes when an item is moved.
+        for Count in range(Position, self.__Count):
+            self.__Hash ^= self.__GetKey(Count)
+    # ADDED CODE ENDS
+
+class Player:
+    __slots__ = ("__Score", "__Name", "__Direction", "__Id", "__Queue") # CODE ADDED
+
+    def __init__(self, N, D, QueueCapacity=5):
+        self.__Score = 100
+        self.__Name = N
+        self.__Direction = D
+        self.__Id = D
+        self.__Queue = MoveOptionQueue(D, QueueCapacity) # CODE EDITED
+
+    # CODE EDITED STARTS
+    # Players are told apart by their id (their direction, 1 or -1) rather than
+    # their name, and pieces and kotlas store the id of the player they belong to.
+    def SameAs(self, APlayer):
+        if APlayer is None:
+            return False
+        else:
+            return APlayer.GetId() == self.__Id
+
+    def GetId(self):
+        return self.__Id
+    # CODE EDITED ENDS
+
+    def GetPlayerStateAsString(self):
+        return self.__Name + "\n" + "Score: " + str(self.__Score) + "\n" + "Move option queue: " + self.__Queue.GetQueueAsString() + "\n"
+
+    def AddToMoveOptionQueue(self, NewMoveOption):
+        self.__Queue.Add(NewMoveOption)
+
+    def UpdateQueueAfterMove(self, Position):
+        self.__Queue.MoveItemToBack(Position - 1)
+
+    def UndoQueueAfterMove(self, Position):
+        self.__Queue.MoveBackItemTo(Position - 1) # CODE ADDED
+
+    def UpdateMoveOptionQueueWithOffer(self, Position, NewMoveOption):
+        self.__Queue.Replace(Position, NewMoveOption)
+
+    def GetScore(self):
+        return self.__Score
+
+    def GetName(self):
+        return self.__Name
+
+    def GetDirection(self):
+        return self.__Direction
+
+    def GetQueue(self):
+        return self.__Queue
+
+    def ChangeScore(self, Amount):
+        self.__Score += Amount
+
+    def CheckPlayerMove(self, Pos, StartSquareReference, FinishSquareReference):
+        Temp = self.__Queue.GetMoveOptionInPosition(Pos - 1)
+        return Temp.CheckIfThereIsAMoveToSquare(StartSquareReference, FinishSquareReference)
+
+# ADDED CODE STARTS
+def CheckRandomStreamCopies(Seed=0):
+    # Returns the ways a copied or pickled game or stream fails to carry on
+    # exactly as the original does, which should be none.
+    Failures = []
+    Game = Dastan(6, 6, 4, Seed)
+    Game.SpawnRandom()
+    Game.take_offer(1)
+    Stream = RandomStream(Seed)
+    Stream.random()
+    Stream.Spawn()
+    for Name, Copy in (("deepcopy", copy.deepcopy), ("pickle", lambda Object: pickle.loads(pickle.dumps(Object)))):
+        StreamCopy = Copy(Stream)
+        GameCopy = Copy(Game)
+        if StreamCopy.GetSeed() != Stream.GetSeed():
+            Failures.append(Name + " changes the stream's seed")
+        if [StreamCopy.Spawn().GetSeed() for Count in range(3)] + [StreamCopy.random()] != [Stream.Spawn().GetSeed() for Count in range(3)] + [Stream.random()]:
+            Failures.append(Name + " changes what the stream spawns")
+        if [GameCopy.SpawnRandom().GetSeed() for Count in range(3)] != [Game.SpawnRandom().GetSeed() for Count in range(3)]:
+            Failures.append(Name + " changes what the game spawns")
+        GameCopy.take_offer(1)
+        Game.take_offer(1)
+        if GameCopy.GetHash() != Game.GetHash():
+            Failures.append(Name + " changes the next offer")
+    return Failures
+# ADDED CODE ENDS
+
+def Main():
+    # CODE ADDED STARTS
+    if "--check" in sys.argv:
+        Failures = CheckRandomStreamCopies()
+        for Failure in Failures:
+            print(Failure)
+        print(str(len(Failures)) + " problems with copied random streams")
+        if Failures:
+            sys.exit(1)
+        return
+    # CODE ADDED ENDS
+    ThisGame = Dastan(6, 6, 4)
+    ThisGame.PlayGame()
+    print("Goodbye!")
+    input()
+
+if __name__ == "__main__":
+    Main()
\ No newline at end of file
@@ -6,7 +6,8 @@
 import random
 
 class Dastan:
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = []
@@ -16,6 +17,7 @@ class Dastan:
         self._NoOfRows = R
         self._NoOfColumns = C
         self._MoveOptionOfferPosition = 0
+        self._ForwardRays = self.__CreateForwardRays() # CODE ADDED
         self.__CreateMoveOptionOffer()
         self.__CreateBoard()
         self.__CreatePieces(NoOfPieces)
@@ -111,7 +113,7 @@ class Dastan:
         ReplaceChoice = int(input("Choose the move option from your queue to replace (1 to 5): "))
         self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         ScoreAdjustment = 0
@@ -142,16 +144,10 @@ class Dastan:
                 StartSquareReference = self.__GetSquareReference("containing the piece to move")
                 SquareIsValid = self.__CheckSquareIsValid(StartSquareReference, True)
             if self._CurrentPlayer.GetMoveName(Choice) == "ForwardBound":
-                FinishSquareReference = StartSquareReference
+                # CODE EDITED STARTS
+                FinishSquareReference = self.__SlideForward(StartSquareReference)
                 MoveLegal = True
-                NoPieceInSquare = True
-                while MoveLegal and SquareIsValid and NoPieceInSquare:
-                    TempStartSquareReference = FinishSquareReference
-                    FinishSquareReference = int(str((FinishSquareReference // 10) + (1 * self._CurrentPlayer.GetDirection())) + str(FinishSquareReference % 10))
-                    SquareIsValid = self.__CheckSquareIsValid(FinishSquareReference, False)
-                    NoPieceInSquare = self._Board[self.__GetIndexOfSquare(FinishSquareReference)].GetPieceInSquare() == None
-                    MoveLegal = self._CurrentPlayer.CheckPlayerMove(Choice, TempStartSquareReference, FinishSquareReference)
-                FinishSquareReference = TempStartSquareReference
+                # CODE EDITED ENDS
             else:
                 SquareIsValid = False
                 while not SquareIsValid:
@@ -173,6 +169,34 @@ class Dastan:
         self.__DisplayState()
         self.__DisplayFinalResult()
 
+    # CODE ADDED STARTS
+    def __CreateForwardRays(self):
+        # For each direction (1 or -1) and each square index, the indexes of the
+        # squares straight ahead of it up to the edge of the board, nearest first.
+        ForwardRays = {}
+        for Direction in (1, -1):
+            Rays = []
+            for Index in range(self._NoOfRows * self._NoOfColumns):
+                Ray = []
+                Row = Index // self._NoOfColumns + Direction
+                while 0 <= Row < self._NoOfRows:
+                    Ray.append(Row * self._NoOfColumns + Index % self._NoOfColumns)
+                    Row += Direction
+                Rays.append(tuple(Ray))
+            ForwardRays[Direction] = Rays
+        return ForwardRays
+
+    def __SlideForward(self, StartSquareReference):
+        # The last empty square on the precomputed ray ahead of the piece before
+        # another piece or the edge of the board, or the start square if there is none.
+        FinishSquareReference = StartSquareReference
+        for Index in self._ForwardRays[self._CurrentPlayer.GetDirection()][self.__GetIndexOfSquare(StartSquareReference)]:
+            if self._Board[Index].GetPieceInSquare() != None:
+                break
+            FinishSquareReference = (Index // self._NoOfColumns + 1) * 10 + Index % self._NoOfColumns + 1
+        return FinishSquareReference
+    # CODE ADDED ENDS
+
     def __UpdateBoard(self, StartSquareReference, FinishSquareReference):
         self._Board[self.__GetIndexOfSquare(FinishSquareReference)].SetPiece(self._Board[self.__GetIndexOfSquare(StartSquareReference)].RemovePiece())
 
@@ -0,0 +1,214 @@
+#Monte Carlo Tree Search computer player for the headless Dastan engine (Engine.py)
+#run this file to play against the computer as Player One
+
+import math
+import random
+import time
+from Engine import Dastan
+
+def RandomPlayout(Game, Moves, Rng):
+    return Rng.choice(Moves)
+
+def GreedyPlayout(Game, Moves, Rng):
+    # Takes the most valuable capture on offer, otherwise plays at random.
+    BestPoints = 0
+    BestMoves = []
+    for Move in Moves:
+        Points = Game.GetCapturePoints(Move[2])
+        if Points > BestPoints:
+            BestPoints = Points
+            BestMoves = [Move]
+        elif Points == BestPoints and Points > 0:
+            BestMoves.append(Move)
+    if BestMoves:
+        return Rng.choice(BestMoves)
+    return Rng.choice(Moves)
+
+class MCTSNode:
+    # A decision node is a position with a player to move and one child per
+    # (Move, OfferSlot) action. Taking the offer leads to a chance node instead,
+    # whose children are the five possible new offer positions.
+    def __init__(self, Parent, Action, Mover, IsChance=False, Key=None):
+        self.Parent = Parent
+        self.Action = Action
+        self.Mover = Mover
+        self.IsChance = IsChance
+        self.Key = Key
+        self.Children = {}
+        self.UntriedActions = None
+        self.Visits = 0
+        self.TotalValue = 0.0
+
+class MCTSPlayer:
+    # UCT search. Values are kept from the point of view of the player who
+    # made the action leading to each node, between 0 (lost) and 1 (won).
+    # Playouts stop at MaxPlayoutDepth turns and are then scored from the
+    # current score difference. The tree below the chosen move is kept and
+    # reused on the next call if the position reached is found in it. Nodes are
+    # matched by Game.GetSearchKey(), as positions with the same pieces and
+    # queues but different scores are worth different amounts.
+    def __init__(self, Playouts=1000, TimeLimitMs=None, Exploration=1.4, PlayoutPolicy=RandomPlayout, MaxPlayoutDepth=60, UseOffers=True, ScoreScale=10, Seed=None):
+        self.__Playouts = Playouts
+        self.__TimeLimitMs = TimeLimitMs
+        self.__Exploration = Exploration
+        self.__PlayoutPolicy = PlayoutPolicy
+        self.__MaxPlayoutDepth = MaxPlayoutDepth
+        self.__UseOffers = UseOffers
+        self.__ScoreScale = ScoreScale
+        self.__Random = random.Random(Seed)
+        self.__Root = None
+        self.__LastSearchInfo = {}
+
+    def GetLastSearchInfo(self):
+        return self.__LastSearchInfo
+
+    def ChooseMove(self, Game):
+        # Returns (Move, OfferSlot) in the same form as AlphaBetaPlayer.ChooseMove.
+        StartTime = time.perf_counter()
+        Deadline = None
+        if self.__TimeLimitMs is not None:
+            Deadline = StartTime + self.__TimeLimitMs / 1000
+        Root = self.__FindReusableRoot(Game)
+        ReusedVisits = 0
+        if Root is None:
+            Root = MCTSNode(None, None, 1 - self.__GetPlayerIndex(Game), False, Game.GetSearchKey())
+        else:
+            Root.Parent = None
+            ReusedVisits = Root.Visits
+        Count = 0
+        while (self.__Playouts is None or Count < self.__Playouts) and (Deadline is None or time.perf_counter() < Deadline):
+            self.__RunIteration(Game, Root)
+            Count += 1
+        if not Root.Children:
+            self.__Root = None
+            return (None, 0)
+        Best = max(Root.Children.values(), key=lambda Child: Child.Visits)
+        self.__Root = Best
+        self.__LastSearchInfo = {"Playouts": Count, "ReusedVisits": ReusedVisits, "Value": Best.TotalValue / Best.Visits, "TimeMs": (time.perf_counter() - StartTime) * 1000}
+        return Best.Action
+
+    def PlayTurn(self, Game):
+        Move, OfferSlot = self.ChooseMove(Game)
+        if OfferSlot:
+            Game.take_offer(OfferSlot)
+        Game.apply(Move)
+
+    def __GetPlayerIndex(self, Game):
+        if Game.GetCurrentPlayer().GetId() == 1:
+            return 0
+        else:
+            return 1
+
+    def __FindReusableRoot(self, Game):
+        # Looks a few plies below the node of our last move for the position we
+        # are now in, which is there if the opponent's reply was explored.
+        if self.__Root is None:
+            return None
+        Key = Game.GetSearchKey()
+        Level = [self.__Root]
+        for Depth in range(4):
+            NextLevel = []
+            for Node in Level:
+                if not Node.IsChance and Node.Key == Key:
+                    return Node
+                NextLevel.extend(Node.Children.values())
+            Level = NextLevel
+        return None
+
+    def __RunIteration(self, Game, Root):
+        Node = Root
+        Undos = []
+        try:
+            while True:
+                if Node.IsChance:
+                    Position = self.__Random.randint(0, 4)
+                    Undos.append(Game.make_move(Node.Action[0], Node.Action[1], Position))
+                    Child = Node.Children.get(Position)
+                    if Child is None:
+                        Child = MCTSNode(Node, Position, Node.Mover, False, Game.GetSearchKey())
+                        Node.Children[Position] = Child
+                        Node = Child
+                        break
+                    Node = Child
+                    continue
+                if Game.is_terminal():
+                    break
+                if Node.UntriedActions is None:
+                    Node.UntriedActions = self.__GetActions(Game)
+                if Node.UntriedActions:
+                    Action = Node.UntriedActions.pop()
+                    Mover = self.__GetPlayerIndex(Game)
+                    if Action[1]:
+                        Child = MCTSNode(Node, Action, Mover, True)
+                        Node.Children[Action] = Child
+                        Node = Child
+                        continue
+                    Undos.append(Game.make_move(Action[0]))
+                    Child = MCTSNode(Node, Action, Mover, False, Game.GetSearchKey())
+                    Node.Children[Action] = Child
+                    Node = Child
+                    break
+                Node = self.__SelectChild(Node)
+                if not Node.IsChance:
+                    Undos.append(Game.make_move(Node.Action[0]))
+            Result = self.__Playout(Game, Undos)
+        finally:
+            while Undos:
+                Game.unmake_move(Undos.pop())
+        while Node is not None:
+            Node.Visits += 1
+            if Node.Mover == 0:
+                Node.TotalValue += Result
+            else:
+                Node.TotalValue += 1 - Result
+            Node = Node.Parent
+
+    def __SelectChild(self, Node):
+        LogVisits = math.log(Node.Visits)
+        BestScore = -1
+        BestChild = None
+        for Child in Node.Children.values():
+            Score = Child.TotalValue / Child.Visits + self.__Exploration * math.sqrt(LogVisits / Child.Visits)
+            if Score > BestScore:
+                BestScore = Score
+                BestChild = Child
+        return BestChild
+
+    def __GetActions(self, Game):
+        CurrentPlayer = Game.GetCurrentPlayer()
+        Actions = [(Move, 0) for Move in Game.GenerateLegalMoves(CurrentPlayer)]
+        if self.__UseOffers:
+            Actions.extend((Move, Move[0]) for Move in Game.GenerateOfferMoves(CurrentPlayer))
+        if not Actions:
+            Actions.append((None, 0))
+        self.__Random.shuffle(Actions)
+        return Actions
+
+    def __Playout(self, Game, Undos):
+        # Returns the result for Player One between 0 and 1.
+        Depth = 0
+        while not Game.is_terminal() and Depth < self.__MaxPlayoutDepth:
+            Moves = Game.GenerateLegalMoves(Game.GetCurrentPlayer())
+            if Moves:
+                Undos.append(Game.make_move(self.__PlayoutPolicy(Game, Moves, self.__Random)))
+            else:
+                Undos.append(Game.make_move(None))
+            Depth += 1
+        Player1Score, Player2Score = Game.scores()
+        Difference = Player1Score - Player2Score
+        if Game.is_terminal():
+            if Difference > 0:
+                return 1.0
+            elif Difference < 0:
+                return 0.0
+            return 0.5
+        return 0.5 + Difference / (2 * (abs(Difference) + self.__ScoreScale))
+
+def Main():
+    ThisGame = Dastan(6, 6, 4)
+    ThisGame.PlayGame({1: MCTSPlayer(TimeLimitMs=1000, Playouts=None)})
+    print("Goodbye!")
+    input()
+
+if __name__ == "__main__":
+    Main()
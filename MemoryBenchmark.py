@@ -0,0 +1,101 @@
+#Memory benchmark for the headless Dastan engine (Engine.py)
+#example: python MemoryBenchmark.py --boards 2000 --rows 6 --columns 6
+
+import argparse
+import gc
+import sys
+import tracemalloc
+import Engine
+from Engine import Dastan, Piece, Square, Kotla, Move, MoveOption, Player
+
+def MeasureBytesPerBoard(NoOfBoards, Rows, Columns, NoOfPieces):
+    # Games are created with fixed seeds so that each one's random stream costs
+    # the same. The first game is made before measuring so that the caches
+    # shared by every game (move options, move tables, Zobrist keys) are not counted.
+    Dastan(Rows, Columns, NoOfPieces, 0)
+    gc.collect()
+    tracemalloc.start()
+    Before = tracemalloc.get_traced_memory()[0]
+    Games = [Dastan(Rows, Columns, NoOfPieces, Seed) for Seed in range(NoOfBoards)]
+    After = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    # Games are kept alive until after the measurement.
+    return (After - Before) / len(Games)
+
+def GetSlotNames(AClass):
+    # Names of the slots of AClass and its bases, with private names mangled.
+    Names = []
+    for Base in AClass.__mro__:
+        for Name in Base.__dict__.get("__slots__", ()):
+            if Name.startswith("__") and not Name.endswith("__"):
+                Name = "_" + Base.__name__.lstrip("_") + Name
+            Names.append(Name)
+    return Names
+
+def GetDeepSize(Object, Seen):
+    # Bytes of Object and everything it refers to that is not in Seen, adding
+    # what it counts to Seen. Strings are all shared constants, and so are
+    # small ints, so neither is counted.
+    if id(Object) in Seen or isinstance(Object, (str, type)) or (isinstance(Object, int) and -5 <= Object <= 256) or Object is None:
+        return 0
+    Seen.add(id(Object))
+    Size = sys.getsizeof(Object)
+    if isinstance(Object, dict):
+        for Key, Value in Object.items():
+            Size += GetDeepSize(Key, Seen) + GetDeepSize(Value, Seen)
+    elif isinstance(Object, (list, tuple, set)):
+        for Item in Object:
+            Size += GetDeepSize(Item, Seen)
+    if hasattr(Object, "__dict__") and not isinstance(Object, type):
+        Size += GetDeepSize(Object.__dict__, Seen)
+    for Name in GetSlotNames(type(Object)):
+        if hasattr(Object, Name):
+            Size += GetDeepSize(getattr(Object, Name), Seen)
+    return Size
+
+def GetBreakdown(Game):
+    # Bytes of each part of one game, leaving out the caches every game shares.
+    Seen = set()
+    for Shared in (Engine._MoveOptions, Engine._MoveTables, Engine._PieceKeys, Engine._ZobristKeys):
+        GetDeepSize(Shared, Seen)
+    Parts = []
+    Parts.append(("Squares and pieces", GetDeepSize(Game._Board, Seen)))
+    Parts.append(("BitBoard", GetDeepSize(Game._BitBoard, Seen)))
+    Parts.append(("Players and move option queues", GetDeepSize(Game._Players, Seen)))
+    Parts.append(("Random stream", GetDeepSize(Game._Random, Seen)))
+    Parts.append(("Game object and the rest", GetDeepSize(Game, Seen)))
+    return Parts
+
+def GetInstanceSize(AClass, *Args):
+    # Shallow size of one instance, plus its __dict__ if it has one.
+    Instance = AClass(*Args)
+    Size = sys.getsizeof(Instance)
+    if hasattr(Instance, "__dict__"):
+        Size += sys.getsizeof(Instance.__dict__)
+    return Size
+
+def Main():
+    Parser = argparse.ArgumentParser(description="Report how much memory each Dastan board takes.")
+    Parser.add_argument("--boards", type=int, default=1000)
+    Parser.add_argument("--rows", type=int, default=6)
+    Parser.add_argument("--columns", type=int, default=6)
+    Parser.add_argument("--pieces", type=int, default=4)
+    Args = Parser.parse_args()
+    print("Bytes per instance:")
+    print("  Piece: " + str(GetInstanceSize(Piece, "piece", 1, 1, "!")))
+    print("  Square: " + str(GetInstanceSize(Square)))
+    print("  Kotla: " + str(GetInstanceSize(Kotla, 1, "K")))
+    print("  Move: " + str(GetInstanceSize(Move, 1, 0)))
+    print("  MoveOption: " + str(GetInstanceSize(MoveOption, "ryott")))
+    print("  Player: " + str(GetInstanceSize(Player, "Player One", 1)))
+    BytesPerBoard = MeasureBytesPerBoard(Args.boards, Args.rows, Args.columns, Args.pieces)
+    print("Bytes per " + str(Args.rows) + "x" + str(Args.columns) + " board: " + str(round(BytesPerBoard)) + " (average of " + str(Args.boards) + ")")
+    print("Bytes per part of a new board:")
+    for Name, Size in GetBreakdown(Dastan(Args.rows, Args.columns, Args.pieces, 0)):
+        print("  " + Name + ": " + str(Size))
+    Game = Dastan(Args.rows, Args.columns, Args.pieces, 0)
+    Game.GetRandom()
+    print("  Random stream once it is used: " + str(dict(GetBreakdown(Game))["Random stream"]))
+
+if __name__ == "__main__":
+    Main()
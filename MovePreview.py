@@ -6,7 +6,8 @@
 import random
 
 class Dastan:
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = []
@@ -21,62 +22,55 @@ class Dastan:
         self.__CreatePieces(NoOfPieces)
         self._CurrentPlayer = self._Players[0]
 
+    # CODE EDITED STARTS
+    # Both the board and the preview are built up as one string and printed
+    # with a single write instead of one print per cell.
     def __DisplayBoard(self):
-        print("\n" + "   ", end="")
-        for Column in range(1, self._NoOfColumns + 1):
-            print(str(Column) + "  ", end="")
-        print("\n" + "  ", end="")
-        for Count in range(1, self._NoOfColumns + 1):
-            print("---", end="")
-        print("-")
+        print(self.__GetBoardAsString(self.__GetCellText), end="")
+
+    def __GetCellText(self, SquareReference):
+        ASquare = self._Board[self.__GetIndexOfSquare(SquareReference)]
+        PieceInSquare = ASquare.GetPieceInSquare()
+        if PieceInSquare is None:
+            return ASquare.GetSymbol() + " "
+        else:
+            return ASquare.GetSymbol() + PieceInSquare.GetSymbol()
+
+    def __GetBoardAsString(self, GetCellText):
+        # GetCellText gives the two characters shown in each square.
+        Lines = ["\n" + "   " + "".join(str(Column) + "  " for Column in range(1, self._NoOfColumns + 1))]
+        Lines.append("  " + "---" * self._NoOfColumns + "-")
         for Row in range(1, self._NoOfRows + 1):
-            print(str(Row) + " ", end="")
+            Cells = [str(Row) + " "]
             for Column in range(1, self._NoOfColumns + 1):
-                Index = self.__GetIndexOfSquare(Row * 10 + Column)
-                print("|" + self._Board[Index].GetSymbol(), end="")
-                PieceInSquare = self._Board[Index].GetPieceInSquare()
-                if PieceInSquare is None:
-                    print(" ", end="")
-                else:
-                    print(PieceInSquare.GetSymbol(), end="")
-            print("|")
-        print("  -", end="")
-        for Column in range(1, self._NoOfColumns + 1):
-            print("---", end="")
-        print()
-        print()
+                Cells.append("|" + GetCellText(Row * 10 + Column))
+            Cells.append("|")
+            Lines.append("".join(Cells))
+        Lines.append("  -" + "---" * self._NoOfColumns)
+        return "\n".join(Lines) + "\n\n"
+    # CODE EDITED ENDS
 
     ## ADDED CODE STARTS
-    def __PreviewMove(self, position, startSquareRef):
-        print("Possible Moves:")
-        print("\n" + "   ", end="")
-        for Column in range(1, self._NoOfColumns + 1):
-            print(str(Column) + "  ", end="")
-        print("\n" + "  ", end="")
-        for Count in range(1, self._NoOfColumns + 1):
-            print("---", end="")
-        print("-")
-        tempMoveOption = self.__CreateMoveOption(self._CurrentPlayer.GetQueue().GetMoveOptionInPosition(position - 1).GetName(),
-                                self._CurrentPlayer.GetDirection())
-        for Row in range(1, self._NoOfRows + 1):
-            print(str(Row) + " ", end="")
-            for Column in range(1, self._NoOfColumns + 1):
-                print("|", end="")
-                piece = self._Board[self.__GetIndexOfSquare(Row * 10 + Column)].GetPieceInSquare()
-                if piece != None:
-                    piece = self._CurrentPlayer.SameAs(piece.GetBelongsTo())
-                else:
-                    piece = False
-                if tempMoveOption.CheckIfThereIsAMoveToSquare(startSquareRef,(Row * 10 + Column)) and not (piece):
-                    print((Row * 10 + Column), end="")
-                else:
-                    print("  ", end="")       
-            print("|")
-        print("  -", end="")
-        for Column in range(1, self._NoOfColumns + 1):
-            print("---", end="")
-        print()
-        print()
+    def ReachableSquares(self, Choice, StartSquareReference):
+        # The set of square references the current player's piece on StartSquareReference
+        # could move to using move option Choice, leaving out squares holding their own
+        # pieces. Worked out once per move, for both the preview and checking the move.
+        Reachable = set()
+        for Row, Column in self._CurrentPlayer.GetQueue().GetMoveOptionInPosition(Choice - 1).GetFinishSquares(StartSquareReference):
+            if Row < 1 or Row > self._NoOfRows or Column < 1 or Column > self._NoOfColumns:
+                continue
+            piece = self._Board[self.__GetIndexOfSquare(Row * 10 + Column)].GetPieceInSquare()
+            if piece == None or not self._CurrentPlayer.SameAs(piece.GetBelongsTo()):
+                Reachable.add(Row * 10 + Column)
+        return Reachable
+
+    def __PreviewMove(self, reachable):
+        def GetPreviewText(squareRef):
+            if squareRef in reachable:
+                return str(squareRef)
+            else:
+                return "  "
+        print("Possible Moves:\n" + self.__GetBoardAsString(GetPreviewText), end="")
     ## ADDED CODE ENDS
 
     def __DisplayState(self):
@@ -144,7 +138,7 @@ class Dastan:
         ReplaceChoice = int(input("Choose the move option from your queue to replace (1 to 5): "))
         self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         ScoreAdjustment = 0
@@ -174,12 +168,13 @@ class Dastan:
             while not SquareIsValid:
                 StartSquareReference = self.__GetSquareReference("containing the piece to move")
                 SquareIsValid = self.__CheckSquareIsValid(StartSquareReference, True)
-            self.__PreviewMove(Choice,StartSquareReference) ## CODE ADDED
+            Reachable = self.ReachableSquares(Choice, StartSquareReference) ## CODE ADDED
+            self.__PreviewMove(Reachable) ## CODE ADDED
             SquareIsValid = False
             while not SquareIsValid:
                 FinishSquareReference = self.__GetSquareReference("to move to")
                 SquareIsValid = self.__CheckSquareIsValid(FinishSquareReference, False)
-            MoveLegal = self._CurrentPlayer.CheckPlayerMove(Choice, StartSquareReference, FinishSquareReference)
+            MoveLegal = FinishSquareReference in Reachable ## CODE EDITED
             if MoveLegal:
                 PointsForPieceCapture = self.__CalculatePieceCapturePoints(FinishSquareReference)
                 self._CurrentPlayer.ChangeScore(-(Choice + (2 * (Choice - 1))))
@@ -412,6 +407,14 @@ class MoveOption:
     def GetName(self):
         return self._Name
 
+    ## CODE ADDED STARTS
+    def GetFinishSquares(self, StartSquareReference):
+        # (Row, Column) of the square each move leads to, which may be off the board.
+        StartRow = StartSquareReference // 10
+        StartColumn = StartSquareReference % 10
+        return [(StartRow + M.GetRowChange(), StartColumn + M.GetColumnChange()) for M in self._PossibleMoves]
+    ## CODE ADDED ENDS
+
     def CheckIfThereIsAMoveToSquare(self, StartSquareReference, FinishSquareReference):
         StartRow = StartSquareReference // 10
         StartColumn = StartSquareReference % 10
@@ -8,7 +8,8 @@ import random
 
 class Dastan:
 
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = []
@@ -99,14 +100,18 @@ class Dastan:
     def __CheckIfGameOver(self):
         Player1HasMirza = False
         Player2HasMirza = False
+        # CODE EDITED STARTS
+        # each player's kotla is looked up directly instead of checking every square for one
+        for APlayer in self._Players:
+            PieceInSquare = self._Board[
+                APlayer.GetKotlaSquare()].GetPieceInSquare()
+            if PieceInSquare is not None and PieceInSquare.GetTypeOfPiece(
+            ) == "mirza" and not PieceInSquare.GetBelongsTo().SameAs(APlayer):
+                return True
         for S in self._Board:
             PieceInSquare = S.GetPieceInSquare()
             if PieceInSquare is not None:
-                if S.ContainsKotla() and PieceInSquare.GetTypeOfPiece(
-                ) == "mirza" and not PieceInSquare.GetBelongsTo().SameAs(
-                        S.GetBelongsTo()):
-                    return True
-                elif PieceInSquare.GetTypeOfPiece(
+                if PieceInSquare.GetTypeOfPiece(
                 ) == "mirza" and PieceInSquare.GetBelongsTo().SameAs(
                         self._Players[0]):
                     Player1HasMirza = True
@@ -114,6 +119,7 @@ class Dastan:
                 ) == "mirza" and PieceInSquare.GetBelongsTo().SameAs(
                         self._Players[1]):
                     Player2HasMirza = True
+        # CODE EDITED ENDS
         return not (Player1HasMirza and Player2HasMirza)
 
     def __GetSquareReference(self, Description):
@@ -133,12 +139,16 @@ class Dastan:
                 self._MoveOptionOffer[self._MoveOptionOfferPosition],
                 self._CurrentPlayer.GetDirection()))
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         ScoreAdjustment = 0
-        for S in self._Board:
-            ScoreAdjustment += (S.GetPointsForOccupancy(CurrentPlayer))
+        # CODE EDITED STARTS
+        # only kotla squares can give points, so only they are checked
+        for APlayer in self._Players:
+            ScoreAdjustment += (self._Board[APlayer.GetKotlaSquare()].
+                                GetPointsForOccupancy(CurrentPlayer))
+        # CODE EDITED ENDS
         return ScoreAdjustment
 
     def __UpdatePlayerScore(self, PointsForPieceCapture):
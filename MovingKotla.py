@@ -6,7 +6,8 @@
 import random
 
 class Dastan:
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = []
@@ -19,6 +20,12 @@ class Dastan:
         self.__CreateMoveOptionOffer()
         self.__CreateBoard()
         self.__CreatePieces(NoOfPieces)
+        # CODE ADDED STARTS
+        self._EmptySquares = EmptySquares()
+        for Index in range(len(self._Board)):
+            if self._Board[Index].GetPieceInSquare() is None:
+                self._EmptySquares.Add(Index)
+        # CODE ADDED ENDS
         self._CurrentPlayer = self._Players[0]
 
     def __DisplayBoard(self):
@@ -92,15 +99,20 @@ class Dastan:
     def __CheckIfGameOver(self):
         Player1HasMirza = False
         Player2HasMirza = False
+        # CODE EDITED STARTS
+        # each player's kotla is looked up directly instead of checking every square for one
+        for APlayer in self._Players:
+            PieceInSquare = self._Board[APlayer.GetKotlaSquare()].GetPieceInSquare()
+            if PieceInSquare is not None and PieceInSquare.GetTypeOfPiece() == "mirza" and not PieceInSquare.GetBelongsTo().SameAs(APlayer):
+                return True
         for S in self._Board:
             PieceInSquare = S.GetPieceInSquare()
             if PieceInSquare is not None:
-                if S.ContainsKotla() and PieceInSquare.GetTypeOfPiece() == "mirza" and not PieceInSquare.GetBelongsTo().SameAs(S.GetBelongsTo()):
-                    return True
-                elif PieceInSquare.GetTypeOfPiece() == "mirza" and PieceInSquare.GetBelongsTo().SameAs(self._Players[0]):
+                if PieceInSquare.GetTypeOfPiece() == "mirza" and PieceInSquare.GetBelongsTo().SameAs(self._Players[0]):
                     Player1HasMirza = True
                 elif PieceInSquare.GetTypeOfPiece() == "mirza" and PieceInSquare.GetBelongsTo().SameAs(self._Players[1]):
                     Player2HasMirza = True
+        # CODE EDITED ENDS
         return not (Player1HasMirza and Player2HasMirza)
 
     def __GetSquareReference(self, Description):
@@ -111,12 +123,15 @@ class Dastan:
         ReplaceChoice = int(input("Choose the move option from your queue to replace (1 to 5): "))
         self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         ScoreAdjustment = 0
-        for S in self._Board:
-            ScoreAdjustment += (S.GetPointsForOccupancy(CurrentPlayer))
+        # CODE EDITED STARTS
+        # only kotla squares can give points, so only they are checked
+        for APlayer in self._Players:
+            ScoreAdjustment += (self._Board[APlayer.GetKotlaSquare()].GetPointsForOccupancy(CurrentPlayer))
+        # CODE EDITED ENDS
         return ScoreAdjustment
 
     def __UpdatePlayerScore(self, PointsForPieceCapture):
@@ -165,17 +180,25 @@ class Dastan:
         self.__DisplayFinalResult()
     # START OF CANE
     def __MoveKotla(self):
-        square = random.randint(0,len(self._Board))
-        while not(self._Board[square].GetPieceInSquare() == None):
-            square = random.randint(0,len(self._Board))
-        for kotla in range(len(self._Board)):
-            if self._Board[kotla].GetBelongsTo() == self._CurrentPlayer:
-                t =  self._Board[square]
-                self._Board[square] = self._Board[kotla]
-                self._Board[kotla] = t
+        square = self._EmptySquares.ChooseSquare(self._Random)
+        kotla = self._CurrentPlayer.GetKotlaSquare()
+        t =  self._Board[square]
+        self._Board[square] = self._Board[kotla]
+        self._Board[kotla] = t
+        # a piece on the kotla moves with it, leaving its old square empty
+        if self._Board[square].GetPieceInSquare() is not None:
+            self._EmptySquares.Remove(square)
+            self._EmptySquares.Add(kotla)
+        # the empty square picked can be the other player's kotla, so both swapped squares are updated
+        for APlayer in self._Players:
+            if APlayer.GetKotlaSquare() == square:
+                APlayer.SetKotlaSquare(kotla)
+        self._CurrentPlayer.SetKotlaSquare(square)
     # END OF CANE
     def __UpdateBoard(self, StartSquareReference, FinishSquareReference):
         self._Board[self.__GetIndexOfSquare(FinishSquareReference)].SetPiece(self._Board[self.__GetIndexOfSquare(StartSquareReference)].RemovePiece())
+        self._EmptySquares.Add(self.__GetIndexOfSquare(StartSquareReference)) # CODE ADDED
+        self._EmptySquares.Remove(self.__GetIndexOfSquare(FinishSquareReference)) # CODE ADDED
 
     def __DisplayFinalResult(self):
         if self._Players[0].GetScore() == self._Players[1].GetScore():
@@ -190,8 +213,10 @@ class Dastan:
             for Column in range(1, self._NoOfColumns + 1):
                 if Row == 1 and Column == self._NoOfColumns // 2:
                     S = Kotla(self._Players[0], "K")
+                    self._Players[0].SetKotlaSquare(len(self._Board)) # CODE ADDED
                 elif Row == self._NoOfRows and Column == self._NoOfColumns // 2 + 1:
                     S = Kotla(self._Players[1], "k")
+                    self._Players[1].SetKotlaSquare(len(self._Board)) # CODE ADDED
                 else:
                     S = Square()
                 self._Board.append(S)
@@ -380,6 +405,39 @@ class Kotla(Square):
             else:
                 return 0
 
+# CODE ADDED STARTS
+class EmptySquares:
+    # The indexes of the empty squares, kept in a list along with where each one
+    # is in it, so a square can be added, removed or picked at random in constant
+    # time however crowded the board is.
+    def __init__(self):
+        self.__Squares = []
+        self.__Positions = {}
+
+    def Add(self, Index):
+        if Index not in self.__Positions:
+            self.__Positions[Index] = len(self.__Squares)
+            self.__Squares.append(Index)
+
+    def Remove(self, Index):
+        Position = self.__Positions.pop(Index, None)
+        if Position is not None:
+            Last = self.__Squares.pop()
+            if Last != Index:
+                self.__Squares[Position] = Last
+                self.__Positions[Last] = Position
+
+    def Contains(self, Index):
+        return Index in self.__Positions
+
+    def GetNoOfSquares(self):
+        return len(self.__Squares)
+
+    def ChooseSquare(self, Rng):
+        # Every empty square is equally likely.
+        return Rng.choice(self.__Squares)
+# CODE ADDED ENDS
+
 class MoveOption:
     def __init__(self, N):
         self._Name = N
@@ -444,6 +502,7 @@ class Player:
         self.__Name = N
         self.__Direction = D
         self.__Queue = MoveOptionQueue()
+        self.__KotlaSquare = 0 # CODE ADDED
 
     def SameAs(self, APlayer):
         if APlayer is None:
@@ -468,6 +527,15 @@ class Player:
     def GetScore(self):
         return self.__Score
 
+    # CODE ADDED STARTS
+    # the index in the board of the square this player's kotla is on
+    def GetKotlaSquare(self):
+        return self.__KotlaSquare
+
+    def SetKotlaSquare(self, Index):
+        self.__KotlaSquare = Index
+    # CODE ADDED ENDS
+
     def GetName(self):
         return self.__Name
 
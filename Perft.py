@@ -0,0 +1,99 @@
+#Perft for the headless Dastan engine (Engine.py): counts the positions reachable
+#from the start of Dastan(6, 6, 4) to check move generation and make/unmake and time them
+#example: python Perft.py --depth 3 --no-offers
+
+import argparse
+import sys
+import time
+from Engine import Dastan
+
+# Counts by (UseOffers, Depth). The counts without offers up to depth 3 match
+# a brute force search over every choice and pair of squares in the original program.
+REFERENCECOUNTS = {
+    (False, 1): 45,
+    (False, 2): 2340,
+    (False, 3): 96630,
+    (False, 4): 4377439,
+    (True, 1): 1290,
+    (True, 2): 1708065,
+}
+
+def GetActions(Game, UseOffers):
+    # Every (Move, OfferSlot, NewOfferPosition) open to the current player. Taking
+    # the offer can replace any of the five queue positions and the new offer can
+    # be any of the five options, so each of those is a branch of its own.
+    CurrentPlayer = Game.GetCurrentPlayer()
+    Moves = Game.GenerateLegalMoves(CurrentPlayer)
+    Actions = [(Move, 0, None) for Move in Moves]
+    if not Actions:
+        Actions.append((None, 0, None))
+    if UseOffers:
+        OfferMoves = Game.GenerateOfferMoves(CurrentPlayer)
+        for Slot in range(1, 6):
+            SlotMoves = [Move for Move in Moves if Move[0] != Slot] + [Move for Move in OfferMoves if Move[0] == Slot]
+            if not SlotMoves:
+                SlotMoves.append(None)
+            for Position in range(5):
+                Actions.extend((Move, Slot, Position) for Move in SlotMoves)
+    return Actions
+
+def Perft(Game, Depth, UseOffers=True):
+    # Number of move sequences of length Depth; a finished game has no moves.
+    if Depth == 0:
+        return 1
+    if Game.is_terminal():
+        return 0
+    Actions = GetActions(Game, UseOffers)
+    if Depth == 1:
+        return len(Actions)
+    Count = 0
+    for Move, OfferSlot, Position in Actions:
+        Undo = Game.make_move(Move, OfferSlot, Position)
+        Count += Perft(Game, Depth - 1, UseOffers)
+        Game.unmake_move(Undo)
+    return Count
+
+def Divide(Game, Depth, UseOffers=True):
+    # Perft below each first action, for tracking down where two engines differ.
+    Counts = []
+    for Move, OfferSlot, Position in GetActions(Game, UseOffers):
+        Undo = Game.make_move(Move, OfferSlot, Position)
+        Counts.append(((Move, OfferSlot, Position), Perft(Game, Depth - 1, UseOffers)))
+        Game.unmake_move(Undo)
+    return Counts
+
+def Main():
+    Parser = argparse.ArgumentParser(description="Count and time the positions reachable from the start of a 6x6 Dastan game.")
+    Parser.add_argument("--depth", type=int, default=2)
+    Parser.add_argument("--no-offers", action="store_true", help="leave out the branches that take the move option offer")
+    Parser.add_argument("--divide", action="store_true", help="print the count below each first action")
+    Args = Parser.parse_args()
+    UseOffers = not Args.no_offers
+    Game = Dastan(6, 6, 4, 0)
+    StartHash = Game.GetHash()
+    if Args.divide:
+        for Action, Count in Divide(Game, Args.depth, UseOffers):
+            print(str(Action) + ": " + str(Count))
+    Failed = False
+    for Depth in range(1, Args.depth + 1):
+        StartTime = time.perf_counter()
+        Count = Perft(Game, Depth, UseOffers)
+        Elapsed = time.perf_counter() - StartTime
+        Line = "Depth " + str(Depth) + ": " + str(Count) + " nodes in " + str(round(Elapsed, 2)) + "s (" + str(round(Count / max(Elapsed, 1e-9))) + " nodes/s)"
+        Reference = REFERENCECOUNTS.get((UseOffers, Depth))
+        if Reference is None:
+            Line += "  no reference count"
+        elif Reference == Count:
+            Line += "  ok"
+        else:
+            Line += "  WRONG, expected " + str(Reference)
+            Failed = True
+        print(Line)
+    if Game.GetHash() != StartHash:
+        print("The position was not restored after searching")
+        Failed = True
+    if Failed:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    Main()
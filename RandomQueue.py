@@ -6,7 +6,8 @@
 import random
 
 class Dastan:
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = []
@@ -111,7 +112,7 @@ class Dastan:
         ReplaceChoice = int(input("Choose the move option from your queue to replace (1 to 5): "))
         self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         ScoreAdjustment = 0
@@ -290,13 +291,13 @@ class Dastan:
         self._Players[0].AddToMoveOptionQueue(self.__CreateMoveOption("cuirassier", 1))
         self._Players[0].AddToMoveOptionQueue(self.__CreateMoveOption("faujdar", 1))
         self._Players[0].AddToMoveOptionQueue(self.__CreateMoveOption("jazair", 1))
-        self._Players[0].RandomizeQueue()
+        self._Players[0].RandomizeQueue(self._Random)
         self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("ryott", -1))
         self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("chowkidar", -1))
         self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("jazair", -1))
         self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("faujdar", -1))
         self._Players[1].AddToMoveOptionQueue(self.__CreateMoveOption("cuirassier", -1))
-        self._Players[1].RandomizeQueue()
+        self._Players[1].RandomizeQueue(self._Random)
 
 class Piece:
     def __init__(self, T, B, P, S):
@@ -427,11 +428,11 @@ class MoveOptionQueue:
     def GetMoveOptionInPosition(self, Pos):
         return self.__Queue[Pos]
 
-    def Randomize(self):
+    def Randomize(self, Rng):
         tempQueue = self.__Queue
         self.__Queue = []
         while tempQueue:
-            move = random.choice(tempQueue)
+            move = Rng.choice(tempQueue)
             tempQueue.remove(move)
             self.__Queue.append(move)
 
@@ -462,8 +463,8 @@ class Player:
     def UpdateMoveOptionQueueWithOffer(self, Position, NewMoveOption):
         self.__Queue.Replace(Position, NewMoveOption)
 
-    def RandomizeQueue(self):
-        self.__Queue.Randomize()
+    def RandomizeQueue(self, Rng):
+        self.__Queue.Randomize(Rng)
 
     def GetScore(self):
         return self.__Score
@@ -5,21 +5,27 @@
 
 import random
 
+# CODE ADDED STARTS
+# The changes of each move option for direction 1, made once for every game.
+_Moves = {
+    "ryott": ((0, 1), (0, -1), (1, 0), (-1, 0)),
+    "faujdar": ((0, 1), (0, -1), (0, 2), (0, -2)),
+    "jazair": ((2, 0), (2, -2), (2, 2), (0, 2), (0, -2), (-1, 1), (-1, 1)),
+    "cuirassier": ((1, -2), (1, 2), (1, 0), (2, 0)),
+    "chowkidar": ((1, 1), (1, -1), (-1, 1), (-1, -1), (0, 2), (0, -2))
+}
+_MoveOptionCache = {}
+# CODE ADDED ENDS
+
 class Dastan:
 
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = [Player("Player One", 1), Player("Player Two", -1)]
         self._MoveOptionOffer = ['jazair', 'chowkidar', 'cuirassier', 'ryott',
             'faujdar'
         ]
-        self._Moves = {
-            "ryott": ((0, 1), (0, -1), (1, 0), (-1, 0)),
-            "faujdar": ((0, 1), (0, -1), (0, 2), (0, -2)),
-            "jazair": ((2, 0), (2, -2), (2, 2), (0, 2), (0, -2), (-1, 1), (-1, 1)),
-            "cuirassier": ((1, -2), (1, 2), (1, 0), (2, 0)),
-            "chowkidar": ((1, 1), (1, -1), (-1, 1), (-1, -1), (0, 2), (0, -2))
-        }
         self.__CreateMoveOptions()
         self._NoOfRows = R
         self._NoOfColumns = C
@@ -118,7 +124,7 @@ class Dastan:
         ReplaceChoice = int(input("Choose the move option from your queue to replace (1 to 5): "))
         self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         ScoreAdjustment = 0
@@ -203,11 +209,21 @@ class Dastan:
         self._Board[self.__GetIndexOfSquare(self._NoOfRows * 10 + (self._NoOfColumns // 2 + 1))].SetPiece(CurrentPiece)
 
     def __CreateMoveOption(self, Name, Direction):
+        # CODE EDITED STARTS
+        # A move option is never changed after it is made, so one object per name
+        # and direction is shared by every game instead of building a new one each time.
+        if (Name, Direction) in _MoveOptionCache:
+            return _MoveOptionCache[(Name, Direction)]
+        # CODE EDITED ENDS
         NewMoveOption = MoveOption(Name)
-        for i in range(len(self._Moves[Name])):
-            NewMove = Move(self._Moves[Name][i][0] * Direction,
-                           self._Moves[Name][i][1] * Direction)
+        for i in range(len(_Moves[Name])): # CODE EDITED
+            NewMove = Move(_Moves[Name][i][0] * Direction,
+                           _Moves[Name][i][1] * Direction) # CODE EDITED
             NewMoveOption.AddToPossibleMoves(NewMove)
+        # CODE ADDED STARTS
+        NewMoveOption.Freeze()
+        _MoveOptionCache[(Name, Direction)] = NewMoveOption
+        # CODE ADDED ENDS
         return NewMoveOption
 
     def __CreateMoveOptions(self):
@@ -293,10 +309,23 @@ class MoveOption:
     def __init__(self, N):
         self._Name = N
         self._PossibleMoves = []
+        self._Frozen = False # CODE ADDED
 
     def AddToPossibleMoves(self, M):
+        # CODE ADDED STARTS
+        if self._Frozen:
+            raise TypeError("Move option " + self._Name + " is shared and cannot be changed")
+        # CODE ADDED ENDS
         self._PossibleMoves.append(M)
 
+    # CODE ADDED STARTS
+    # A frozen move option keeps its moves in a tuple and refuses any more, as
+    # one object is shared by every game.
+    def Freeze(self):
+        self._PossibleMoves = tuple(self._PossibleMoves)
+        self._Frozen = True
+    # CODE ADDED ENDS
+
     def GetName(self):
         return self._Name
 
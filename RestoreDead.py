@@ -6,7 +6,8 @@
 import random
 
 class Dastan:
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = []
@@ -19,6 +20,12 @@ class Dastan:
         self.__CreateMoveOptionOffer()
         self.__CreateBoard()
         self.__CreatePieces(NoOfPieces)
+        # CODE ADDED STARTS
+        self._EmptySquares = EmptySquares()
+        for Index in range(len(self._Board)):
+            if self._Board[Index].GetPieceInSquare() is None:
+                self._EmptySquares.Add(Index)
+        # CODE ADDED ENDS
         self._CurrentPlayer = self._Players[0]
 
     def __DisplayBoard(self):
@@ -111,7 +118,7 @@ class Dastan:
         ReplaceChoice = int(input("Choose the move option from your queue to replace (1 to 5): "))
         self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         ScoreAdjustment = 0
@@ -146,10 +153,9 @@ class Dastan:
             for index,piece in enumerate(pieces):
                 print(f"{index+1}) {piece.GetSymbol()}")
             Choice = int(input("Choose a piece to restore: "))
-        square = random.choice(self._Board)
-        while square.GetPieceInSquare() != None:
-            square = random.choice(self._Board)
-        square.SetPiece(pieces[Choice-1])
+        square = self._EmptySquares.ChooseSquare(self._Random)
+        self._Board[square].SetPiece(pieces[Choice-1])
+        self._EmptySquares.Remove(square)
     # ADDED CODE ENDS
 
     def PlayGame(self):
@@ -193,6 +199,8 @@ class Dastan:
 
     def __UpdateBoard(self, StartSquareReference, FinishSquareReference):
         self._Board[self.__GetIndexOfSquare(FinishSquareReference)].SetPiece(self._Board[self.__GetIndexOfSquare(StartSquareReference)].RemovePiece())
+        self._EmptySquares.Add(self.__GetIndexOfSquare(StartSquareReference)) # CODE ADDED
+        self._EmptySquares.Remove(self.__GetIndexOfSquare(FinishSquareReference)) # CODE ADDED
 
     def __DisplayFinalResult(self):
         if self._Players[0].GetScore() == self._Players[1].GetScore():
@@ -397,6 +405,39 @@ class Kotla(Square):
             else:
                 return 0
 
+# CODE ADDED STARTS
+class EmptySquares:
+    # The indexes of the empty squares, kept in a list along with where each one
+    # is in it, so a square can be added, removed or picked at random in constant
+    # time however crowded the board is.
+    def __init__(self):
+        self.__Squares = []
+        self.__Positions = {}
+
+    def Add(self, Index):
+        if Index not in self.__Positions:
+            self.__Positions[Index] = len(self.__Squares)
+            self.__Squares.append(Index)
+
+    def Remove(self, Index):
+        Position = self.__Positions.pop(Index, None)
+        if Position is not None:
+            Last = self.__Squares.pop()
+            if Last != Index:
+                self.__Squares[Position] = Last
+                self.__Positions[Last] = Position
+
+    def Contains(self, Index):
+        return Index in self.__Positions
+
+    def GetNoOfSquares(self):
+        return len(self.__Squares)
+
+    def ChooseSquare(self, Rng):
+        # Every empty square is equally likely.
+        return Rng.choice(self.__Squares)
+# CODE ADDED ENDS
+
 class MoveOption:
     def __init__(self, N):
         self._Name = N
@@ -0,0 +1,75 @@
+#Rule variants of the headless Dastan engine (Engine.py) for bots and the tournament runner
+#each one plays like the variant program of the same name, through PlayGame as well as the
+#bot API, since the engine checks for the end of the game with is_terminal() and takes
+#offers with take_offer()
+
+from Engine import Dastan, GetZobristKey
+
+class EndGameAt0(Dastan):
+    # EndGame@0.py: the game also ends when a player's score drops to 0 or below.
+    def is_terminal(self):
+        if Dastan.is_terminal(self):
+            return True
+        for APlayer in self._Players:
+            if APlayer.GetScore() <= 0:
+                return True
+        return False
+
+class ThreeOffersPerPlayer(Dastan):
+    # 3OffersPerPlayer.py: each player can take the move option offer only
+    # NoOfOffers times in a game. The offers left are part of the hash, since
+    # they change which moves are open.
+    def __init__(self, R, C, NoOfPieces, Seed=None, Rng=None, NoOfOffers=3):
+        Dastan.__init__(self, R, C, NoOfPieces, Seed, Rng)
+        self._OffersLeft = [NoOfOffers, NoOfOffers]
+        self._OffersHash = GetZobristKey("offersleft", 0, NoOfOffers) ^ GetZobristKey("offersleft", 1, NoOfOffers)
+
+    def GetOffersLeft(self, APlayer):
+        return self._OffersLeft[self.__GetPlayerIndex(APlayer)]
+
+    def GenerateOfferMoves(self, APlayer):
+        if self.GetOffersLeft(APlayer) <= 0:
+            return []
+        return Dastan.GenerateOfferMoves(self, APlayer)
+
+    def take_offer(self, Slot):
+        # The offer is only used up once the engine has accepted the slot.
+        self.__CheckOffersLeft(self._CurrentPlayer)
+        Dastan.take_offer(self, Slot)
+        self.__ChangeOffersLeft(self.__GetPlayerIndex(self._CurrentPlayer), -1)
+
+    def make_move(self, Move, OfferSlot=0, NewOfferPosition=None):
+        if OfferSlot:
+            self.__UseOffer(self._CurrentPlayer)
+        return Dastan.make_move(self, Move, OfferSlot, NewOfferPosition)
+
+    def unmake_move(self, Undo):
+        Dastan.unmake_move(self, Undo)
+        if Undo[3]:
+            self.__ChangeOffersLeft(self.__GetPlayerIndex(self._CurrentPlayer), 1)
+
+    def GetHash(self):
+        return Dastan.GetHash(self) ^ self._OffersHash
+
+    def __CheckOffersLeft(self, APlayer):
+        if self.GetOffersLeft(APlayer) <= 0:
+            raise ValueError(APlayer.GetName() + " has no offers left")
+
+    def __UseOffer(self, APlayer):
+        self.__CheckOffersLeft(APlayer)
+        self.__ChangeOffersLeft(self.__GetPlayerIndex(APlayer), -1)
+
+    def __ChangeOffersLeft(self, PlayerIndex, Amount):
+        self._OffersHash ^= GetZobristKey("offersleft", PlayerIndex, self._OffersLeft[PlayerIndex])
+        self._OffersLeft[PlayerIndex] += Amount
+        self._OffersHash ^= GetZobristKey("offersleft", PlayerIndex, self._OffersLeft[PlayerIndex])
+
+    def __GetPlayerIndex(self, APlayer):
+        return (1 - APlayer.GetId()) // 2
+
+# The variants a tournament can be played under, by the name of their program.
+RULEVARIANTS = {
+    "Original": Dastan,
+    "EndGame@0": EndGameAt0,
+    "3OffersPerPlayer": ThreeOffersPerPlayer,
+}
@@ -0,0 +1,162 @@
+#Self-play tournament runner for the headless Dastan engine (Engine.py)
+#example: python Tournament.py --games 200 --player-one alphabeta --player-two mcts --output results.jsonl
+#--variant plays under the rules of one of the variant programs in RuleVariants.py
+
+import argparse
+import json
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from RuleVariants import RULEVARIANTS
+from AlphaBetaPlayer import AlphaBetaPlayer
+from MCTSPlayer import MCTSPlayer, GreedyPlayout
+
+class RandomPlayer:
+    def __init__(self, Seed=None):
+        self.__Random = random.Random(Seed)
+
+    def ChooseMove(self, Game):
+        Moves = Game.legal_moves()
+        if not Moves:
+            return (None, 0)
+        return (self.__Random.choice(Moves), 0)
+
+class GreedyPlayer:
+    # Plays the highest scoring capture, or a random cheapest move.
+    def __init__(self, Seed=None):
+        self.__Random = random.Random(Seed)
+
+    def ChooseMove(self, Game):
+        Moves = Game.legal_moves()
+        if not Moves:
+            return (None, 0)
+        BestKey = None
+        BestMoves = []
+        for Move in Moves:
+            Key = (Game.GetCapturePoints(Move[2]), -Move[0])
+            if BestKey is None or Key > BestKey:
+                BestKey = Key
+                BestMoves = [Move]
+            elif Key == BestKey:
+                BestMoves.append(Move)
+        return (self.__Random.choice(BestMoves), 0)
+
+PLAYERTYPES = ("random", "greedy", "alphabeta", "mcts")
+
+def CreatePlayer(Name, Seed, TimeLimitMs, Playouts):
+    if Name == "random":
+        return RandomPlayer(Seed)
+    elif Name == "greedy":
+        return GreedyPlayer(Seed)
+    elif Name == "alphabeta":
+        return AlphaBetaPlayer(TimeLimitMs, TTSizeInMB=8)
+    elif Name == "mcts":
+        if Playouts:
+            return MCTSPlayer(Playouts=Playouts, Seed=Seed, PlayoutPolicy=GreedyPlayout)
+        return MCTSPlayer(Playouts=None, TimeLimitMs=TimeLimitMs, Seed=Seed, PlayoutPolicy=GreedyPlayout)
+    raise ValueError("Unknown player type " + Name)
+
+def GetGameSeed(Seed, GameNo):
+    # Each game's seed depends only on the tournament seed and the game number,
+    # so a game can be replayed alone whichever worker originally ran it.
+    return random.Random(Seed * 1000003 + GameNo).getrandbits(32)
+
+def PlayOneGame(Settings):
+    GameNo, GameSeed, Variant, Names, Rows, Columns, NoOfPieces, MaxTurns, TimeLimitMs, Playouts = Settings
+    Game = RULEVARIANTS[Variant](Rows, Columns, NoOfPieces, GameSeed)
+    Players = [CreatePlayer(Names[0], Game.SpawnRandom().GetSeed(), TimeLimitMs, Playouts), CreatePlayer(Names[1], Game.SpawnRandom().GetSeed(), TimeLimitMs, Playouts)]
+    Turns = 0
+    StartTime = time.perf_counter()
+    while not Game.is_terminal() and Turns < MaxTurns:
+        if Game.GetCurrentPlayer().GetId() == 1:
+            Move, OfferSlot = Players[0].ChooseMove(Game)
+        else:
+            Move, OfferSlot = Players[1].ChooseMove(Game)
+        if OfferSlot:
+            Game.take_offer(OfferSlot)
+        Game.apply(Move)
+        Turns += 1
+    Scores = Game.scores()
+    if Scores[0] > Scores[1]:
+        Winner = 0
+    elif Scores[1] > Scores[0]:
+        Winner = 1
+    else:
+        Winner = None
+    return {"Game": GameNo, "Seed": GameSeed, "Variant": Variant, "Players": list(Names), "Scores": list(Scores), "Winner": Winner, "Turns": Turns, "Finished": Game.is_terminal(), "TimeMs": round((time.perf_counter() - StartTime) * 1000, 1)}
+
+def GetSettings(Args):
+    for GameNo in range(Args.games):
+        Names = (Args.player_one, Args.player_two)
+        if Args.swap_sides and GameNo % 2 == 1:
+            Names = (Args.player_two, Args.player_one)
+        yield (GameNo, GetGameSeed(Args.seed, GameNo), Args.variant, Names, Args.rows, Args.columns, Args.pieces, Args.max_turns, Args.time_ms, Args.playouts)
+
+def GetStatsLabel(Side, Name):
+    # Totals are kept per side and bot, so a bot playing itself or both bots
+    # swapping sides are still reported apart.
+    if Side == 0:
+        return "Player One (" + Name + ")"
+    return "Player Two (" + Name + ")"
+
+def RunTournament(Args):
+    Stats = {}
+    for Names in set(Settings[3] for Settings in GetSettings(Args)):
+        for Side in range(2):
+            Stats[GetStatsLabel(Side, Names[Side])] = {"Wins": 0, "Points": 0, "Games": 0}
+    Draws = 0
+    Unfinished = 0
+    Completed = 0
+    StartTime = time.perf_counter()
+    with open(Args.output, "w") as Output, ProcessPoolExecutor(max_workers=Args.workers) as Executor:
+        Futures = [Executor.submit(PlayOneGame, Settings) for Settings in GetSettings(Args)]
+        for Future in as_completed(Futures):
+            Result = Future.result()
+            Output.write(json.dumps(Result) + "\n")
+            Output.flush()
+            Completed += 1
+            if not Result["Finished"]:
+                Unfinished += 1
+            if Result["Winner"] is None:
+                Draws += 1
+            for Side in range(2):
+                Label = GetStatsLabel(Side, Result["Players"][Side])
+                Stats[Label]["Games"] += 1
+                Stats[Label]["Points"] += Result["Scores"][Side]
+                if Result["Winner"] == Side:
+                    Stats[Label]["Wins"] += 1
+            if Args.progress:
+                print("Game " + str(Result["Game"]) + ": " + " v ".join(Result["Players"]) + " " + str(Result["Scores"][0]) + "-" + str(Result["Scores"][1]) + " (" + str(Completed) + "/" + str(Args.games) + ")")
+    Elapsed = time.perf_counter() - StartTime
+    print()
+    print("Rules: " + Args.variant)
+    print("Games: " + str(Completed) + " in " + str(round(Elapsed, 1)) + "s (" + str(round(Completed / max(Elapsed, 1e-9), 2)) + " games/s)")
+    print("Draws: " + str(Draws) + "   Unfinished after " + str(Args.max_turns) + " turns: " + str(Unfinished))
+    for Label in sorted(Stats):
+        Games = max(Stats[Label]["Games"], 1)
+        print(Label + ": " + str(Stats[Label]["Wins"]) + " wins in " + str(Stats[Label]["Games"]) + " games, average score " + str(round(Stats[Label]["Points"] / Games, 2)))
+    print("Results written to " + Args.output)
+    return Stats
+
+def Main():
+    Parser = argparse.ArgumentParser(description="Play Dastan bots against each other across all cores.")
+    Parser.add_argument("--games", type=int, default=100)
+    Parser.add_argument("--workers", type=int, default=os.cpu_count())
+    Parser.add_argument("--seed", type=int, default=0)
+    Parser.add_argument("--variant", choices=list(RULEVARIANTS), default="Original", help="the rules to play under")
+    Parser.add_argument("--player-one", choices=PLAYERTYPES, default="greedy")
+    Parser.add_argument("--player-two", choices=PLAYERTYPES, default="random")
+    Parser.add_argument("--swap-sides", action="store_true", help="alternate which bot plays Player One")
+    Parser.add_argument("--time-ms", type=int, default=100, help="thinking time per move for alphabeta and mcts")
+    Parser.add_argument("--playouts", type=int, default=0, help="fixed playouts per move for mcts instead of --time-ms")
+    Parser.add_argument("--rows", type=int, default=6)
+    Parser.add_argument("--columns", type=int, default=6)
+    Parser.add_argument("--pieces", type=int, default=4)
+    Parser.add_argument("--max-turns", type=int, default=300)
+    Parser.add_argument("--output", default="tournament_results.jsonl")
+    Parser.add_argument("--progress", action="store_true", help="print each game as it finishes")
+    RunTournament(Parser.parse_args())
+
+if __name__ == "__main__":
+    Main()
@@ -0,0 +1,104 @@
+#Transposition table for searching Dastan games played with Engine.py
+#positions are identified by Dastan.GetHash()
+
+from array import array
+
+EXACT = 0
+LOWERBOUND = 1
+UPPERBOUND = 2
+
+def EncodeMove(Move, OfferSlot=0):
+    # Packs a (Choice, StartSquareReference, FinishSquareReference) move, or None
+    # for a pass, and the offer slot taken before it into one int. 0 means no move.
+    if Move is None:
+        Choice, StartSquareReference, FinishSquareReference = 0, 0, 0
+    else:
+        Choice, StartSquareReference, FinishSquareReference = Move
+    return 1 + (OfferSlot * 4 + Choice) * 10000 + StartSquareReference * 100 + FinishSquareReference
+
+def DecodeMove(Code):
+    # Inverse of EncodeMove, returns (Move, OfferSlot) or None.
+    if Code == 0:
+        return None
+    Code -= 1
+    OfferSlot, Choice = divmod(Code // 10000, 4)
+    StartSquareReference = Code // 100 % 100
+    FinishSquareReference = Code % 100
+    if Choice == 0:
+        return (None, OfferSlot)
+    return ((Choice, StartSquareReference, FinishSquareReference), OfferSlot)
+
+class TranspositionTable:
+    # Each bucket has two entries: slot 0 keeps the deepest search of the
+    # position (unless it is from an older search) and slot 1 is always
+    # replaced. Entries are held in flat typed arrays, so the memory used is
+    # fixed when the table is made and never grows.
+    BytesPerEntry = 8 + 2 + 8 + 1 + 4 + 2
+
+    def __init__(self, SizeInMB=16):
+        self.__NoOfBuckets = max(1, int(SizeInMB * 1024 * 1024) // (2 * self.BytesPerEntry))
+        self.Clear()
+
+    def GetNoOfEntries(self):
+        return 2 * self.__NoOfBuckets
+
+    def GetSizeInBytes(self):
+        return sum(A.itemsize * len(A) for A in (self.__Keys, self.__Depths, self.__Values, self.__Bounds, self.__Moves, self.__Ages))
+
+    def GetHitRate(self):
+        if self.__Probes == 0:
+            return 0.0
+        return self.__Hits / self.__Probes
+
+    def NewSearch(self):
+        # Entries stored before this call lose their depth preference.
+        self.__Age = self.__Age % 65535 + 1
+
+    def Clear(self):
+        Size = 2 * self.__NoOfBuckets
+        self.__Keys = array("Q", bytes(8 * Size))
+        self.__Depths = array("h", bytes(2 * Size))
+        self.__Values = array("q", bytes(8 * Size))
+        self.__Bounds = array("b", bytes(Size))
+        self.__Moves = array("i", bytes(4 * Size))
+        self.__Ages = array("H", bytes(2 * Size))
+        self.__Age = 1
+        self.__Hits = 0
+        self.__Probes = 0
+
+    def Probe(self, Hash):
+        # Returns (Depth, Value, Bound, EncodedMove) for Hash, or None.
+        self.__Probes += 1
+        Index = (Hash % self.__NoOfBuckets) * 2
+        for Slot in (Index, Index + 1):
+            if self.__Ages[Slot] != 0 and self.__Keys[Slot] == Hash:
+                self.__Hits += 1
+                return (self.__Depths[Slot], self.__Values[Slot], self.__Bounds[Slot], self.__Moves[Slot])
+        return None
+
+    def Store(self, Hash, Depth, Value, Bound, EncodedMove=0):
+        Index = (Hash % self.__NoOfBuckets) * 2
+        if self.__Ages[Index] == 0 or self.__Keys[Index] == Hash or self.__Ages[Index] != self.__Age or Depth >= self.__Depths[Index]:
+            Slot = Index
+            if self.__Ages[Index] != 0 and self.__Keys[Index] != Hash:
+                self.__CopyEntry(Index, Index + 1)
+        else:
+            Slot = Index + 1
+        if EncodedMove == 0 and self.__Ages[Slot] != 0 and self.__Keys[Slot] == Hash:
+            EncodedMove = self.__Moves[Slot]
+        self.__Keys[Slot] = Hash
+        self.__Depths[Slot] = Depth
+        self.__Values[Slot] = Value
+        self.__Bounds[Slot] = Bound
+        self.__Moves[Slot] = EncodedMove
+        self.__Ages[Slot] = self.__Age
+
+    def __CopyEntry(self, From, To):
+        # The entry pushed out of the depth-preferred slot is kept in the
+        # always-replace slot rather than being lost straight away.
+        self.__Keys[To] = self.__Keys[From]
+        self.__Depths[To] = self.__Depths[From]
+        self.__Values[To] = self.__Values[From]
+        self.__Bounds[To] = self.__Bounds[From]
+        self.__Moves[To] = self.__Moves[From]
+        self.__Ages[To] = self.__Ages[From]
@@ -4,10 +4,10 @@
 #developed in the Python 3.9 programming environment
 
 import random
-from copy import deepcopy as copy
 
 class Dastan:
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = []
@@ -22,7 +22,8 @@ class Dastan:
         self.__CreatePieces(NoOfPieces)
         self._CurrentPlayer = self._Players[0]
 
-    def __DisplayBoard(self):
+    def __DisplayBoard(self, Overlay=()):
+        # Squares in Overlay (a collection of indexes) show an m instead of their piece.
         print("\n" + "   ", end="")
         for Column in range(1, self._NoOfColumns + 1):
             print(str(Column) + "  ", end="")
@@ -36,7 +37,9 @@ class Dastan:
                 Index = self.__GetIndexOfSquare(Row * 10 + Column)
                 print("|" + self._Board[Index].GetSymbol(), end="")
                 PieceInSquare = self._Board[Index].GetPieceInSquare()
-                if PieceInSquare is None:
+                if Index in Overlay:
+                    print("m", end="")
+                elif PieceInSquare is None:
                     print(" ", end="")
                 else:
                     print(PieceInSquare.GetSymbol(), end="")
@@ -112,7 +115,7 @@ class Dastan:
         ReplaceChoice = int(input("Choose the move option from your queue to replace (1 to 5): "))
         self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         ScoreAdjustment = 0
@@ -128,22 +131,35 @@ class Dastan:
             return self._Board[self.__GetIndexOfSquare(FinishSquareReference)].GetPieceInSquare().GetPointsIfCaptured()
         return 0
 
+    # CODE EDITED STARTS
+    # The reachable squares come straight from the move option's moves and are
+    # drawn over the live board, rather than deep copying the board (and the
+    # players its pieces belong to) and putting a movePiece on each square.
     def __PrintMoves(self, StartSquareReference, Choice):
-        PreviousBoard = copy(self._Board)
-        PossibleMoves = "Possible Moves: "
-        for i,S in enumerate(self._Board):
-            P = S.GetPieceInSquare()
-            TempFinishSquareRefrence = ((i // self._NoOfColumns + 1 ) * 10 + (i % self._NoOfColumns + 1))
-            MoveLegal = self._CurrentPlayer.CheckPlayerMove(Choice, StartSquareReference, TempFinishSquareRefrence)
-            if P != None and P.GetBelongsTo() == self._CurrentPlayer:
-                MoveLegal = False
-            if MoveLegal:
-                PossibleMoves = PossibleMoves + str(TempFinishSquareRefrence) + " "
-                self._Board[i].SetPiece(movePiece())
-        print(PossibleMoves[:-1])
-        self.__DisplayBoard()
-        self._Board = PreviousBoard
-    
+        Reachable = self.__GetReachableSquares(StartSquareReference, Choice)
+        PossibleMoves = "Possible Moves:"
+        for Index in Reachable:
+            PossibleMoves = PossibleMoves + " " + str((Index // self._NoOfColumns + 1) * 10 + (Index % self._NoOfColumns + 1))
+        print(PossibleMoves)
+        self.__DisplayBoard(Reachable)
+
+    def __GetReachableSquares(self, StartSquareReference, Choice):
+        # Indexes of the squares the piece could move to, in board order.
+        StartRow = StartSquareReference // 10
+        StartColumn = StartSquareReference % 10
+        Reachable = set()
+        for RowChange, ColumnChange in self._CurrentPlayer.GetMoveChanges(Choice):
+            FinishRow = StartRow + RowChange
+            FinishColumn = StartColumn + ColumnChange
+            if FinishRow < 1 or FinishRow > self._NoOfRows or FinishColumn < 1 or FinishColumn > self._NoOfColumns:
+                continue
+            Index = self.__GetIndexOfSquare(FinishRow * 10 + FinishColumn)
+            P = self._Board[Index].GetPieceInSquare()
+            if P is None or not self._CurrentPlayer.SameAs(P.GetBelongsTo()):
+                Reachable.add(Index)
+        return sorted(Reachable)
+    # CODE EDITED ENDS
+
     def PlayGame(self):
         GameOver = False
         while not GameOver:
@@ -345,11 +361,6 @@ class Piece:
     def GetPointsIfCaptured(self):
         return self._PointsIfCaptured
 
-class movePiece(Piece):
-    def __init__(self):
-        Piece.__init__(self, "movePeice", None, 0, "m")
-
-
 class Square:
     def __init__(self):
         self._PieceInSquare = None
@@ -427,6 +438,12 @@ class MoveOption:
     def GetName(self):
         return self._Name
 
+    # CODE ADDED STARTS
+    def GetMoveChanges(self):
+        # The (row change, column change) of each move.
+        return [(M.GetRowChange(), M.GetColumnChange()) for M in self._PossibleMoves]
+    # CODE ADDED ENDS
+
     def CheckIfThereIsAMoveToSquare(self, StartSquareReference, FinishSquareReference):
         StartRow = StartSquareReference // 10
         StartColumn = StartSquareReference % 10
@@ -517,6 +534,12 @@ class Player:
         Temp = self.__Queue.GetMoveOptionInPosition(Pos - 1)
         return Temp.CheckIfThereIsAMoveToSquare(StartSquareReference, FinishSquareReference)
 
+    # CODE ADDED STARTS
+    def GetMoveChanges(self, Pos):
+        Temp = self.__Queue.GetMoveOptionInPosition(Pos - 1)
+        return Temp.GetMoveChanges()
+    # CODE ADDED ENDS
+
 def Main():
     ThisGame = Dastan(6, 6, 4)
     ThisGame.PlayGame()
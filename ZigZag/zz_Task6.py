@@ -6,7 +6,8 @@
 import random
 
 class Dastan:
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = []
@@ -122,7 +123,7 @@ class Dastan:
                 ReplaceChoice = int(ReplaceChoice)
                 self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
                 self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-                self._MoveOptionOfferPosition = random.randint(0, 4)
+                self._MoveOptionOfferPosition = self._Random.randint(0, 4)
           # END OF EDIT
                 
 
@@ -6,7 +6,8 @@
 import random
 
 class Dastan:
-    def __init__(self, R, C, NoOfPieces):
+    def __init__(self, R, C, NoOfPieces, Seed=None):
+        self._Random = random.Random(Seed) # CODE ADDED
         self._Board = []
         self._Players = []
         self._MoveOptionOffer = []
@@ -16,6 +17,7 @@ class Dastan:
         self._NoOfRows = R
         self._NoOfColumns = C
         self._MoveOptionOfferPosition = 0
+        self._ForwardRays = self.__CreateForwardRays() #  EDIT
         self.__CreateMoveOptionOffer()
         self.__CreateBoard()
         self.__CreatePieces(NoOfPieces)
@@ -111,7 +113,7 @@ class Dastan:
         ReplaceChoice = int(input("Choose the move option from your queue to replace (1 to 5): "))
         self._CurrentPlayer.UpdateMoveOptionQueueWithOffer(ReplaceChoice - 1, self.__CreateMoveOption(self._MoveOptionOffer[self._MoveOptionOfferPosition], self._CurrentPlayer.GetDirection()))
         self._CurrentPlayer.ChangeScore(-(10 - (ReplaceChoice * 2)))
-        self._MoveOptionOfferPosition = random.randint(0, 4)
+        self._MoveOptionOfferPosition = self._Random.randint(0, 4)
 
     def __GetPointsForOccupancyByPlayer(self, CurrentPlayer):
         ScoreAdjustment = 0
@@ -130,17 +132,34 @@ class Dastan:
      #  START OF EDIT
         
     def __CalculateSahmMove(self,StartSquareReference):
-        SquareReference = StartSquareReference + (self._CurrentPlayer.GetDirection() * 10)
+        # Sweeps the precomputed ray ahead of the piece, removing every opponent's
+        # piece that is not on a kotla.
         PointsForPieceCapture = 0
-        while self.__CheckSquareInBounds(SquareReference):
-            CurrentSquareInLOS = self._Board[self.__GetIndexOfSquare(SquareReference)]
-            if CurrentSquareInLOS.GetSymbol() not in ("K","k") and CurrentSquareInLOS.GetPieceInSquare() != None:
-                if CurrentSquareInLOS.GetPieceInSquare().GetBelongsTo() != self._CurrentPlayer: 
-                    PointsForPieceCapture = PointsForPieceCapture + self.__CalculatePieceCapturePoints(SquareReference)
+        for Index in self._ForwardRays[self._CurrentPlayer.GetDirection()][self.__GetIndexOfSquare(StartSquareReference)]:
+            CurrentSquareInLOS = self._Board[Index]
+            PieceInSquare = CurrentSquareInLOS.GetPieceInSquare()
+            if PieceInSquare != None and CurrentSquareInLOS.GetSymbol() not in ("K","k"):
+                if PieceInSquare.GetBelongsTo() != self._CurrentPlayer:
+                    PointsForPieceCapture = PointsForPieceCapture + PieceInSquare.GetPointsIfCaptured()
                     CurrentSquareInLOS.RemovePiece()
-            SquareReference = SquareReference + (self._CurrentPlayer.GetDirection() * 10)
         return PointsForPieceCapture
 
+    def __CreateForwardRays(self):
+        # For each direction (1 or -1) and each square index, the indexes of the
+        # squares straight ahead of it up to the edge of the board, nearest first.
+        ForwardRays = {}
+        for Direction in (1, -1):
+            Rays = []
+            for Index in range(self._NoOfRows * self._NoOfColumns):
+                Ray = []
+                Row = Index // self._NoOfColumns + Direction
+                while 0 <= Row < self._NoOfRows:
+                    Ray.append(Row * self._NoOfColumns + Index % self._NoOfColumns)
+                    Row += Direction
+                Rays.append(tuple(Ray))
+            ForwardRays[Direction] = Rays
+        return ForwardRays
+
      #  END OF EDIT
     
     def PlayGame(self):